@@ -5,7 +5,6 @@ MCPM CLI - Main entry point for the Model Context Protocol Manager CLI
 # Import rich-click configuration before anything else
 from typing import Any, Dict
 
-from rich.console import Console
 from rich.traceback import Traceback
 
 from mcpm.clients.client_config import ClientConfigManager
@@ -28,10 +27,11 @@ from mcpm.commands import (
 )
 from mcpm.commands.share import share
 from mcpm.migration import V1ConfigDetector, V1ToV2Migrator
+from mcpm.utils.console import get_console
 from mcpm.utils.logging_config import setup_logging
 from mcpm.utils.rich_click_config import click, get_header_text
 
-console = Console()
+console = get_console()
 client_config_manager = ClientConfigManager()
 
 # Setup Rich logging early - this runs when the module is imported
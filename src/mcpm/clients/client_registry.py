@@ -7,7 +7,6 @@ import logging
 from typing import Dict, List, Optional
 
 from mcpm.clients.base import BaseClientManager
-from mcpm.clients.client_config import ClientConfigManager
 
 # Import all client managers
 from mcpm.clients.managers.claude_code import ClaudeCodeManager
@@ -32,8 +31,9 @@ class ClientRegistry:
     Provides access to client managers and their configurations
     """
 
-    # Client configuration manager for system-wide client settings
-    _client_config_manager = ClientConfigManager()
+    # Cache of default-path manager instances so commands that look up the
+    # same client repeatedly reuse one manager per process
+    _manager_cache: Dict[str, BaseClientManager] = {}
 
     # Dictionary mapping client keys to manager classes
     _CLIENT_MANAGERS = {
@@ -67,9 +67,18 @@ class ClientRegistry:
             BaseClientManager: Client manager instance or None if not found
         """
         manager_class = cls._CLIENT_MANAGERS.get(client_name)
-        if manager_class:
+        if not manager_class:
+            return None
+
+        # Overridden paths bypass the cache; default-path managers are shared
+        if config_path_override:
             return manager_class(config_path_override=config_path_override)
-        return None
+
+        manager = cls._manager_cache.get(client_name)
+        if manager is None:
+            manager = manager_class()
+            cls._manager_cache[client_name] = manager
+        return manager
 
     @classmethod
     def get_all_client_managers(cls) -> Dict[str, BaseClientManager]:
@@ -79,7 +88,7 @@ class ClientRegistry:
         Returns:
             Dict[str, BaseClientManager]: Dictionary mapping client names to manager instances
         """
-        return {name: manager() for name, manager in cls._CLIENT_MANAGERS.items()}
+        return {name: cls.get_client_manager(name) for name in cls._CLIENT_MANAGERS}
 
     @classmethod
     def detect_installed_clients(cls) -> Dict[str, bool]:
@@ -89,7 +98,12 @@ class ClientRegistry:
         Returns:
             Dict[str, bool]: Dictionary mapping client names to installed status
         """
-        return {client_name: manager().is_client_installed() for client_name, manager in cls._CLIENT_MANAGERS.items()}
+        # Reuse the cached managers so each detection pass costs one stat per
+        # client instead of also rebuilding every manager instance
+        return {
+            client_name: cls.get_client_manager(client_name).is_client_installed()
+            for client_name in cls._CLIENT_MANAGERS
+        }
 
     @classmethod
     def get_client_info(cls, client_name: str) -> Dict[str, str]:
@@ -115,7 +129,9 @@ class ClientRegistry:
         Returns:
             Dict[str, Dict[str, str]]: Dictionary mapping client names to display information
         """
-        return {client_name: manager().get_client_info() for client_name, manager in cls._CLIENT_MANAGERS.items()}
+        return {
+            client_name: cls.get_client_manager(client_name).get_client_info() for client_name in cls._CLIENT_MANAGERS
+        }
 
     @classmethod
     def get_recommended_client(cls) -> str | None:
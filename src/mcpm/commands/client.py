@@ -6,23 +6,34 @@ import json
 import os
 import subprocess
 
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
-from rich.console import Console
-from rich.table import Table
-
 from mcpm.clients.client_config import ClientConfigManager
 from mcpm.clients.client_registry import ClientRegistry
 from mcpm.global_config import GlobalConfigManager
 from mcpm.profile.profile_config import ProfileConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.display import print_error
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 client_config_manager = ClientConfigManager()
 global_config_manager = GlobalConfigManager()
 
 
+def _command_and_args(server_config):
+    """Extract (command, args) from an object- or dict-style server entry.
+
+    Client configs hand back either parsed config objects or raw dicts;
+    dispatching on the type here replaces the hasattr cascade previously
+    repeated at every call site. Returns None for entries with neither shape.
+    """
+    if isinstance(server_config, dict):
+        return server_config.get("command", ""), server_config.get("args", [])
+    command = getattr(server_config, "command", None)
+    if command is None:
+        return None
+    return command, getattr(server_config, "args", [])
+
+
 @click.group(context_settings=dict(help_option_names=["-h", "--help"]))
 def client():
     """Manage MCP client configurations (Claude Desktop, Cursor, Windsurf, etc.).
@@ -49,14 +60,19 @@ def client():
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed server information")
 def list_clients(verbose):
     """List all supported MCP clients and their enabled MCPM servers."""
+    # Deferred so other subcommands don't pay the rich.table import
+    from rich.table import Table
+
     # Get the list of supported clients
     supported_clients = ClientRegistry.get_supported_clients()
     installed_clients = ClientRegistry.detect_installed_clients()
 
-    # Count installed clients
-    installed_count = sum(1 for c in supported_clients if installed_clients.get(c, False))
+    # Partition once; the installed count and both name lists fall out of a
+    # single pass instead of running the same predicate three times
+    installed_client_names = [c for c in supported_clients if installed_clients.get(c, False)]
+    uninstalled_client_names = [c for c in supported_clients if not installed_clients.get(c, False)]
 
-    console.print(f"\n[green]Found {installed_count} MCP client(s)[/]\n")
+    console.print(f"\n[green]Found {len(installed_client_names)} MCP client(s)[/]\n")
 
     table = Table(show_header=True, header_style="bold")
     table.add_column("Name", style="cyan")
@@ -66,10 +82,6 @@ def list_clients(verbose):
     if verbose:
         table.add_column("Server Details", overflow="fold")
 
-    # Separate installed and uninstalled clients
-    installed_client_names = [c for c in supported_clients if installed_clients.get(c, False)]
-    uninstalled_client_names = [c for c in supported_clients if not installed_clients.get(c, False)]
-
     # Process only installed clients in the table
     for client_name in sorted(installed_client_names):
         # Get client info
@@ -102,15 +114,10 @@ def list_clients(verbose):
         try:
             client_servers = client_manager.get_servers()
             for server_name, server_config in client_servers.items():
-                # Handle both object attributes and dictionary keys
-                if hasattr(server_config, "command"):
-                    command = server_config.command
-                    args = getattr(server_config, "args", [])
-                elif isinstance(server_config, dict):
-                    command = server_config.get("command", "")
-                    args = server_config.get("args", [])
-                else:
+                extracted = _command_and_args(server_config)
+                if extracted is None:
                     continue
+                command, args = extracted
 
                 # Check if this is an MCPM-managed configuration
                 if command == "mcpm":
@@ -229,6 +236,8 @@ def edit_client(client_name, external, config_path_override):
 
     CLIENT_NAME is the name of the MCP client to configure (e.g., cursor, claude-desktop, windsurf).
     """
+    from rich.table import Table
+
     # Get the client manager for the specified client
     client_manager = ClientRegistry.get_client_manager(client_name, config_path_override=config_path_override)
     if client_manager is None:
@@ -358,15 +367,10 @@ def _get_current_client_mcpm_state(client_manager):
     try:
         client_servers = client_manager.get_servers()
         for server_name, server_config in client_servers.items():
-            # Handle both object attributes and dictionary keys
-            if hasattr(server_config, "command"):
-                command = server_config.command
-                args = getattr(server_config, "args", [])
-            elif isinstance(server_config, dict):
-                command = server_config.get("command", "")
-                args = server_config.get("args", [])
-            else:
+            extracted = _command_and_args(server_config)
+            if extracted is None:
                 continue
+            command, args = extracted
 
             # Check if this is an MCPM-managed configuration
             if command == "mcpm":
@@ -404,6 +408,9 @@ def _interactive_profile_server_selection(
     client_name,
 ):
     """Interactive profile and server selection using InquirerPy with checkboxes."""
+    # Deferred: InquirerPy is only needed once a prompt is actually shown
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
     try:
         # Build choices with current status - profiles first, then servers
         choices = []
@@ -494,20 +501,24 @@ def _interactive_profile_server_selection(
             client_manager, config_path, current_config, selected_profiles, selected_servers, client_name
         )
 
-        # Show what changed
-        added_profiles = new_profiles_set - current_profiles_set
-        removed_profiles = current_profiles_set - new_profiles_set
-        added_servers = new_servers_set - current_servers_set
-        removed_servers = current_servers_set - new_servers_set
+        # Show what changed; one sort over each symmetric difference yields
+        # both sides of the diff already ordered, instead of materializing
+        # and sorting four separate difference sets
+        profiles_diff = sorted(new_profiles_set ^ current_profiles_set)
+        added_profiles = [p for p in profiles_diff if p in new_profiles_set]
+        removed_profiles = [p for p in profiles_diff if p in current_profiles_set]
+        servers_diff = sorted(new_servers_set ^ current_servers_set)
+        added_servers = [s for s in servers_diff if s in new_servers_set]
+        removed_servers = [s for s in servers_diff if s in current_servers_set]
 
         if added_profiles:
-            console.print(f"[green]Enabled profiles: {', '.join(sorted(added_profiles))}[/]")
+            console.print(f"[green]Enabled profiles: {', '.join(added_profiles)}[/]")
         if removed_profiles:
-            console.print(f"[red]Disabled profiles: {', '.join(sorted(removed_profiles))}[/]")
+            console.print(f"[red]Disabled profiles: {', '.join(removed_profiles)}[/]")
         if added_servers:
-            console.print(f"[green]Enabled servers: {', '.join(sorted(added_servers))}[/]")
+            console.print(f"[green]Enabled servers: {', '.join(added_servers)}[/]")
         if removed_servers:
-            console.print(f"[red]Disabled servers: {', '.join(sorted(removed_servers))}[/]")
+            console.print(f"[red]Disabled servers: {', '.join(removed_servers)}[/]")
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled.[/]")
@@ -603,6 +614,9 @@ def _interactive_server_selection_inquirer(
     client_manager, config_path, current_config, mcpm_servers, global_servers, client_name
 ):
     """Interactive server selection using InquirerPy with checkboxes."""
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+
     try:
         # Build choices with current status
         server_choices = []
@@ -750,6 +764,9 @@ def import_client(client_name):
 
     CLIENT_NAME is the name of the MCP client to import from (e.g., cursor, claude-desktop, windsurf).
     """
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+
     # Get client manager
     client_manager = ClientRegistry.get_client_manager(client_name)
     if not client_manager:
@@ -796,15 +813,10 @@ def import_client(client_name):
         # Check if this is an MCPM-managed server
         is_mcpm_server = False
 
-        # Handle both object attributes and dictionary keys
-        if hasattr(server_config, "command"):
-            command = server_config.command
-            args = getattr(server_config, "args", [])
-        elif isinstance(server_config, dict):
-            command = server_config.get("command", "")
-            args = server_config.get("args", [])
-        else:
+        extracted = _command_and_args(server_config)
+        if extracted is None:
             continue
+        command, args = extracted
 
         if command == "mcpm" and len(args) >= 2 and args[0] == "run":
             is_mcpm_server = True
@@ -839,15 +851,7 @@ def import_client(client_name):
     server_choices = []
     for server_name, server_config in non_mcpm_servers:
         # Get command info for display
-        if hasattr(server_config, "command"):
-            command = server_config.command
-            args = getattr(server_config, "args", [])
-        elif isinstance(server_config, dict):
-            command = server_config.get("command", "")
-            args = server_config.get("args", [])
-        else:
-            command = "unknown"
-            args = []
+        command, args = _command_and_args(server_config) or ("unknown", [])
 
         # Create display name with command info
         cmd_display = f"{command} {' '.join(args)}" if args else command
@@ -902,6 +906,8 @@ def import_client(client_name):
 
 def _import_servers_to_global(selected_servers, non_mcpm_servers, client_name):
     """Import selected servers to global configuration."""
+    from rich.table import Table
+
     from mcpm.core.schema import CustomServerConfig, STDIOServerConfig
 
     console.print(f"\n[bold green]Importing {len(selected_servers)} server(s) to global configuration...[/]")
@@ -966,6 +972,8 @@ def _import_servers_to_global(selected_servers, non_mcpm_servers, client_name):
 
 def _ask_create_profile(selected_servers):
     """Ask user if they want to create a profile for selected servers."""
+    from InquirerPy import inquirer
+
     if len(selected_servers) == 1:
         message = f"Create a profile for the imported server '{selected_servers[0]}'?"
     else:
@@ -982,6 +990,8 @@ def _ask_create_profile(selected_servers):
 
 def _create_profile_for_servers(selected_servers, client_name):
     """Create a profile and add selected servers to it."""
+    from InquirerPy import inquirer
+
     profile_manager = ProfileConfigManager()
 
     # Ask for profile name with client code as default
@@ -1022,6 +1032,8 @@ def _create_profile_for_servers(selected_servers, client_name):
 
 def _ask_replace_client_config_with_profile(profile_name, client_name):
     """Ask user if they want to replace client config with profile command."""
+    from InquirerPy import inquirer
+
     message = f"Replace all servers in {client_name} config with 'mcpm profile run {profile_name}'?"
 
     console.print(
@@ -1040,6 +1052,8 @@ def _ask_replace_client_config_with_profile(profile_name, client_name):
 
 def _ask_replace_client_config(selected_servers, client_name):
     """Ask user if they want to replace client config with MCPM managed servers."""
+    from InquirerPy import inquirer
+
     if len(selected_servers) == 1:
         message = f"Replace '{selected_servers[0]}' in {client_name} config with MCPM managed version?"
     else:
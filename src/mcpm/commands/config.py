@@ -2,14 +2,12 @@
 
 import os
 
-from rich.console import Console
-from rich.prompt import Prompt
-
 from mcpm.utils.config import NODE_EXECUTABLES, ConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.repository import RepositoryManager
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 repo_manager = RepositoryManager()
 
 
@@ -33,6 +31,9 @@ def set():
     \b
         mcpm config set
     """
+    # Deferred so other subcommands don't pay the rich.prompt import
+    from rich.prompt import Prompt
+
     set_key = Prompt.ask("Configuration key to set", choices=["node_executable"], default="node_executable")
     node_executable = Prompt.ask(
         "Select default node executable, it will be automatically applied when adding npx server with mcpm add",
@@ -5,15 +5,15 @@ import subprocess
 import sys
 from pathlib import Path
 
-from rich.console import Console
 
 from mcpm.clients.client_registry import ClientRegistry
 from mcpm.profile.profile_config import ProfileConfigManager
 from mcpm.utils.config import ConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.repository import RepositoryManager
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 
 
 @click.command()
@@ -8,16 +8,13 @@ import subprocess
 import sys
 from typing import Any, Dict, Optional
 
-from InquirerPy import inquirer
-from rich.console import Console
-from rich.table import Table
-
 from mcpm.core.schema import RemoteServerConfig, STDIOServerConfig
 from mcpm.global_config import GlobalConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.display import print_error
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 global_config_manager = GlobalConfigManager()
 
 
@@ -40,6 +37,9 @@ def edit(server_name, new, editor):
         mcpm edit -N                                      # Create new server
         mcpm edit -e                                      # Open global config in editor
     """
+    # Deferred so other subcommands don't pay the rich.table import
+    from rich.table import Table
+
     # Handle editor mode
     if editor:
         _open_global_config_in_editor()
@@ -159,6 +159,10 @@ def interactive_server_edit(server_config) -> Optional[Dict[str, Any]]:
     if not sys.stdin.isatty():
         return None
 
+    # Deferred so the non-tty fallback above never pays the InquirerPy
+    # import cost
+    from InquirerPy import inquirer
+
     try:
         # Clear any remaining command line arguments to avoid conflicts
         original_argv = sys.argv[:]
@@ -352,6 +356,37 @@ def _open_global_config_in_editor():
         console.print(f"You can manually edit the file at: {config_path}")
 
 
+def _parse_key_value_pairs(text: str) -> Dict[str, str]:
+    """Parse a "KEY=value,KEY2=value2" string into a dict."""
+    pairs = {}
+    if text:
+        for pair in text.split(","):
+            if "=" in pair:
+                key, value = pair.split("=", 1)
+                pairs[key.strip()] = value.strip()
+    return pairs
+
+
+def _build_stdio_config(name: str, answers: Dict[str, Any]) -> STDIOServerConfig:
+    return STDIOServerConfig(
+        name=name,
+        command=answers["command"],
+        args=shlex.split(answers["args"]) if answers["args"] else [],
+        env=_parse_key_value_pairs(answers["env"]),
+    )
+
+
+def _build_remote_config(name: str, answers: Dict[str, Any]) -> RemoteServerConfig:
+    return RemoteServerConfig(name=name, url=answers["url"], headers=_parse_key_value_pairs(answers["headers"]))
+
+
+# Table-driven dispatch keeps the creation path free of per-type branching
+_SERVER_BUILDERS = {
+    "stdio": _build_stdio_config,
+    "remote": _build_remote_config,
+}
+
+
 def _create_new_server():
     """Create a new server configuration interactively."""
     console.print("[bold green]Create New Server Configuration[/]")
@@ -377,30 +412,7 @@ def _create_new_server():
             return 1
 
         # Create the server config based on type
-        server_type = result["answers"]["type"]
-        if server_type == "stdio":
-            server_config = STDIOServerConfig(
-                name=server_name,
-                command=result["answers"]["command"],
-                args=shlex.split(result["answers"]["args"]) if result["answers"]["args"] else [],
-                env={},
-            )
-
-            # Parse environment variables
-            if result["answers"]["env"]:
-                for env_pair in result["answers"]["env"].split(","):
-                    if "=" in env_pair:
-                        key, value = env_pair.split("=", 1)
-                        server_config.env[key.strip()] = value.strip()
-        else:  # remote
-            server_config = RemoteServerConfig(name=server_name, url=result["answers"]["url"], headers={})
-
-            # Parse headers
-            if result["answers"]["headers"]:
-                for header_pair in result["answers"]["headers"].split(","):
-                    if "=" in header_pair:
-                        key, value = header_pair.split("=", 1)
-                        server_config.headers[key.strip()] = value.strip()
+        server_config = _SERVER_BUILDERS[result["answers"]["type"]](server_name, result["answers"])
 
         # Save the new server
         try:
@@ -423,6 +435,8 @@ def _interactive_new_server_form() -> Optional[Dict[str, Any]]:
     if not sys.stdin.isatty():
         return None
 
+    from InquirerPy import inquirer
+
     try:
         # Clear any remaining command line arguments to avoid conflicts
         original_argv = sys.argv[:]
@@ -2,13 +2,12 @@
 Info command for MCPM - Show detailed information about a specific MCP server
 """
 
-from rich.console import Console
-
+from mcpm.utils.console import get_console
 from mcpm.utils.display import print_error
 from mcpm.utils.repository import RepositoryManager
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 repo_manager = RepositoryManager()
 
 
@@ -4,14 +4,12 @@ import shlex
 import subprocess
 import sys
 
-from rich.console import Console
-from rich.panel import Panel
-
 from mcpm.global_config import GlobalConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.platform import NPX_CMD
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 global_config_manager = GlobalConfigManager()
 
 
@@ -39,6 +37,8 @@ def build_inspector_command(server_config, server_name):
 
 def launch_raw_inspector():
     """Launch raw MCP Inspector without a specified server."""
+    from rich.panel import Panel
+
     # Show information panel with options
     panel_content = """[bold]MCP Inspector without a specific server[/]
 
@@ -124,6 +124,9 @@ def inspect(server_name):
 
     server_name = server_name.strip()
 
+    # Deferred so mcpm --help doesn't pay the rich.panel import
+    from rich.panel import Panel
+
     # Show header
     console.print(
         Panel.fit(f"[bold green]MCPM Inspector[/]\nInspecting server: [cyan]{server_name}[/]", border_style="cyan")
@@ -11,19 +11,16 @@ from prompt_toolkit import PromptSession
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.styles import Style
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm
-
 from mcpm.core.schema import ServerConfig, STDIOServerConfig
 from mcpm.global_config import GlobalConfigManager
 from mcpm.profile.profile_config import ProfileConfigManager
 from mcpm.schemas.full_server_config import FullServerConfig
 from mcpm.utils.config import NODE_EXECUTABLES, ConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.repository import RepositoryManager
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 repo_manager = RepositoryManager()
 profile_config_manager = ProfileConfigManager()
 global_config_manager = GlobalConfigManager()
@@ -133,6 +130,9 @@ def install(server_name, force=False, alias=None):
         mcpm install everything --force
         mcpm install youtube --alias yt
     """
+    # Deferred so other subcommands don't pay the rich.progress import
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Confirm
 
     config_name = alias or server_name
 
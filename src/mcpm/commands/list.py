@@ -2,21 +2,24 @@
 List command for MCP v2.0 - Global Configuration Model
 """
 
+import sys
+from collections import defaultdict
+
 from rich.console import Console
 
-from mcpm.global_config import GlobalConfigManager
-from mcpm.profile.profile_config import ProfileConfigManager
-from mcpm.utils.display import print_server_config
 from mcpm.utils.rich_click_config import click
 
-console = Console()
-profile_manager = ProfileConfigManager()
-global_config_manager = GlobalConfigManager()
+# highlight=False skips Rich's regex auto-highlighter on every printed line
+console = Console(highlight=False)
+
+_VERBOSE_TIP = "[dim]Tip: Use 'mcpm ls -v' to see detailed server configurations[/]"
 
 
 def global_list_servers():
     """List all servers in the global MCPM configuration."""
-    return global_config_manager.list_servers()
+    from mcpm.global_config import GlobalConfigManager
+
+    return GlobalConfigManager().list_servers()
 
 
 @click.command()
@@ -32,52 +35,66 @@ def list(verbose: bool = False):
         mcpm ls -v                 # List servers with detailed configuration
         mcpm profile ls            # List profiles and their included servers
     """
+    # Deferred so unrelated subcommands don't pay these import costs
+    from rich.table import Table
 
-    # v2.0: Use global configuration model
-    console.print("[bold green]MCPM Global Configuration:[/]")
-
-    # Get all servers from global configuration
-    servers = global_list_servers()
-
-    if not servers:
-        console.print("\n[yellow]No MCP servers found in global configuration.[/]")
-        console.print("Use 'mcpm install <server>' to install a server.")
-        console.print()
-        return
-
-    # Get all profiles to show which servers are tagged
-    profiles = profile_manager.list_profiles()
-
-    # Create a mapping of server names to their profile tags
-    server_profiles = {}
-    for profile_name, profile_servers in profiles.items():
-        for server in profile_servers:
-            if server.name not in server_profiles:
-                server_profiles[server.name] = []
-            server_profiles[server.name].append(profile_name)
-
-    console.print(f"\n[bold]Found {len(servers)} server(s) in global configuration:[/]")
-    console.print()
-
-    # Display servers with their profiles
-    for server_name, server_config in servers.items():
-        # Show profiles if any
-        profiles_list = server_profiles.get(server_name, [])
-        if profiles_list:
-            highlighted_profiles = [f"[yellow]{profile}[/]" for profile in profiles_list]
-            profile_display = f" [dim](profiles:[/] {', '.join(highlighted_profiles)}[dim])[/]"
-        else:
-            profile_display = " [dim](no profiles)[/]"
-
-        console.print(f"[bold cyan]{server_name}[/]{profile_display}")
+    from mcpm.profile.profile_config import ProfileConfigManager
 
-        # Only show detailed config in verbose mode
-        if verbose:
-            print_server_config(server_config, show_name=False)
+    # Buffer the whole render and emit it with a single write() at the end
+    with console.capture() as capture:
+        # v2.0: Use global configuration model
+        console.print("[bold green]MCPM Global Configuration:[/]")
 
-    console.print()
+        # Get all servers from global configuration
+        servers = global_list_servers()
 
-    # Add hint about verbose mode if not specified
-    if not verbose:
-        console.print("[dim]Tip: Use 'mcpm ls -v' to see detailed server configurations[/]")
-        console.print()
+        if not servers:
+            console.print("\n[yellow]No MCP servers found in global configuration.[/]")
+            console.print("Use 'mcpm install <server>' to install a server.")
+            console.print()
+        else:
+            # Get all profiles to show which servers are tagged
+            profiles = ProfileConfigManager().list_profiles()
+
+            # Create a mapping of server names to their profile tags; skip the
+            # inversion entirely on fresh installs with no profiles
+            server_profiles = defaultdict(list)
+            if profiles:
+                for profile_name, profile_servers in profiles.items():
+                    for server in profile_servers:
+                        server_profiles[server.name].append(profile_name)
+
+            console.print(f"\n[bold]Found {len(servers)} server(s) in global configuration:[/]")
+            console.print()
+
+            # Render all servers in a single table so Rich lays out and writes once
+            table = Table(show_header=True, header_style="bold")
+            table.add_column("Name", style="cyan")
+            table.add_column("Profiles", overflow="fold")
+            if verbose:
+                table.add_column("Config", overflow="fold")
+            for server_name, server_config in servers.items():
+                profiles_list = server_profiles.get(server_name)
+                profile_display = ", ".join(profiles_list) if profiles_list else "-"
+                row = [server_name, profile_display]
+                if verbose:
+                    # Polymorphic dispatch keeps the listing ignorant of
+                    # individual config schemas
+                    row.append(server_config.summary())
+                table.add_row(*row)
+            console.print(table)
+            console.print()
+
+            # Add hint about verbose mode only for interactive sessions;
+            # piped output stays clean for downstream tooling
+            if not verbose and sys.stdout.isatty():
+                console.print(_VERBOSE_TIP)
+                console.print()
+
+    output = capture.get()
+    if console.is_terminal:
+        # Bracket with DEC 2026 synchronized output so the terminal paints the
+        # listing atomically; terminals without mode 2026 ignore the sequences
+        output = f"\x1b[?2026h{output}\x1b[?2026l"
+    sys.stdout.write(output)
+    sys.stdout.flush()
@@ -1,11 +1,9 @@
 """Migrate command for MCPM - Manual v1 to v2 migration"""
 
-from rich.console import Console
-
-from mcpm.migration import V1ConfigDetector, V1ToV2Migrator
+from mcpm.utils.console import get_console
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 
 
 @click.command()
@@ -21,6 +19,9 @@ def migrate(force):
         mcpm migrate              # Check for v1 config and migrate if found
         mcpm migrate --force      # Force migration check
     """
+    # Deferred so unrelated subcommands don't pay the migration import cost
+    from mcpm.migration import V1ConfigDetector, V1ToV2Migrator
+
     detector = V1ConfigDetector()
 
     if not force and not detector.has_v1_config():
@@ -2,7 +2,6 @@
 New command - alias for 'edit -N' to create new server configurations
 """
 
-from mcpm.commands.edit import _create_new_server
 from mcpm.utils.rich_click_config import click
 
 
@@ -19,4 +18,7 @@ def new():
         mcpm new                                      # Create new server interactively
         mcpm edit -N                                  # Equivalent command
     """
+    # Deferred so unrelated subcommands don't pay the edit import cost
+    from mcpm.commands.edit import _create_new_server
+
     return _create_new_server()
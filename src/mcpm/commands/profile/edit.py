@@ -1,16 +1,33 @@
 """Profile edit command."""
 
-from rich.console import Console
-
-from mcpm.global_config import GlobalConfigManager
 from mcpm.profile.profile_config import ProfileConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.rich_click_config import click
 
-from .interactive import interactive_profile_edit
+console = get_console()
+
+
+def _apply_profile_changes(profile_config_manager, old_name, new_name, selected_servers):
+    """Persist a rename and/or server selection with minimal config saves.
+
+    Single apply path for every edit flow, so save-batching lives in one
+    place rather than being copied per branch.
+    """
+    # If name changed, move metadata and tags to the new name first
+    if new_name != old_name:
+        profile_config_manager.rename_profile(old_name, new_name)
+
+        # Set the full server selection with a single config save
+        profile_config_manager.set_profile_servers(new_name, selected_servers)
 
-console = Console()
-profile_config_manager = ProfileConfigManager()
-global_config_manager = GlobalConfigManager()
+        console.print(f"[green]✅ Profile renamed from '[cyan]{old_name}[/]' to '[cyan]{new_name}[/]'[/]")
+    else:
+        # Same name, just replace the server selection in one save
+        profile_config_manager.set_profile_servers(old_name, selected_servers)
+
+        console.print(f"[green]✅ Profile '[cyan]{old_name}[/]' updated[/]")
+
+    console.print(f"[green]✅ {len(selected_servers)} servers configured in profile[/]")
 
 
 @click.command(name="edit")
@@ -36,6 +53,11 @@ def edit_profile(profile_name, name, servers):
         mcpm profile edit web-dev --servers time,sqlite    # Set servers only
         mcpm profile edit web-dev --name new-name --servers time,weather  # Both
     """
+    profile_config_manager = ProfileConfigManager()
+    # Reuse the profile manager's backing global config instead of
+    # constructing a second manager over the same files
+    global_config_manager = profile_config_manager.global_config
+
     # Check if profile exists
     existing_servers = profile_config_manager.get_profile(profile_name)
     if existing_servers is None:
@@ -67,29 +89,29 @@ def edit_profile(profile_name, name, servers):
             # Parse comma-separated server list
             requested_servers = [s.strip() for s in servers.split(",") if s.strip()]
 
-            # Get all available servers for validation
+            # Pure renames never reach this branch, so this is the only
+            # registry fetch a non-interactive edit pays for
             all_servers = global_config_manager.list_servers()
             if not all_servers:
                 console.print("[yellow]No servers found in global configuration[/]")
                 console.print("[dim]Install servers first with 'mcpm install <server-name>'[/]")
                 return 1
 
-            # Validate requested servers exist
+            # Validate requested servers exist; all_servers is a dict, so
+            # each membership test is O(1)
             invalid_servers = [s for s in requested_servers if s not in all_servers]
             if invalid_servers:
                 console.print(f"[red]Error: Server(s) not found: {', '.join(invalid_servers)}[/]")
                 console.print()
-                console.print("[yellow]Available servers:[/]")
-                for server_name in sorted(all_servers.keys()):
-                    console.print(f"  • {server_name}")
+                console.print(
+                    "[yellow]Available servers:[/]\n" + "\n".join(f"  • {name}" for name in sorted(all_servers))
+                )
                 return 1
 
             selected_servers = set(requested_servers)
         else:
             # Keep current server selection
             selected_servers = {server.name for server in existing_servers} if existing_servers else set()
-            # Get all servers for applying changes
-            all_servers = global_config_manager.list_servers()
 
     else:
         # Interactive mode using InquirerPy
@@ -97,9 +119,7 @@ def edit_profile(profile_name, name, servers):
         console.print("[dim]Use arrow keys to navigate, space to select/deselect, type to search, enter to confirm[/]")
         console.print()
 
-        # Get all available servers from global configuration
         all_servers = global_config_manager.list_servers()
-
         if not all_servers:
             console.print("[yellow]No servers found in global configuration[/]")
             console.print("[dim]Install servers first with 'mcpm install <server-name>'[/]")
@@ -110,6 +130,9 @@ def edit_profile(profile_name, name, servers):
 
         # Run the interactive form
         try:
+            # Deferred so mcpm profile --help doesn't pay the InquirerPy import cost
+            from .interactive import interactive_profile_edit
+
             result = interactive_profile_edit(profile_name, all_servers, current_server_names)
 
             if result is None:
@@ -134,20 +157,27 @@ def edit_profile(profile_name, name, servers):
             console.print(f"[red]Error running interactive editor: {e}[/]")
             return 1
 
-    console.print()
-
-    # Show summary
-    console.print("[bold]Summary of changes:[/]")
-    console.print(f"Profile name: [cyan]{profile_name}[/] → [cyan]{new_name}[/]")
-    console.print(f"Selected servers: [cyan]{len(selected_servers)} servers[/]")
-
+    # Short-circuit before any mutation when the computed state matches the
+    # current one — a no-op edit should never touch the profile store
+    unchanged_names = {server.name for server in existing_servers} if existing_servers else set()
+    if new_name == profile_name and set(selected_servers) == unchanged_names:
+        console.print("[yellow]No changes made.[/]")
+        return 0
+
+    # Show summary; assembled into one print so the whole block hits the
+    # terminal in a single write instead of one per server
+    summary_lines = [
+        "",
+        "[bold]Summary of changes:[/]",
+        f"Profile name: [cyan]{profile_name}[/] → [cyan]{new_name}[/]",
+        f"Selected servers: [cyan]{len(selected_servers)} servers[/]",
+    ]
     if selected_servers:
-        for server_name in sorted(selected_servers):
-            console.print(f"  • {server_name}")
+        summary_lines.extend(f"  • {server_name}" for server_name in sorted(selected_servers))
     else:
-        console.print("  [dim]No servers selected[/]")
-
-    console.print()
+        summary_lines.append("  [dim]No servers selected[/]")
+    summary_lines.append("")
+    console.print("\n".join(summary_lines))
 
     # Confirmation (only for non-interactive mode, InquirerPy handles its own confirmation)
     if is_non_interactive:
@@ -155,32 +185,7 @@ def edit_profile(profile_name, name, servers):
 
     # Apply changes
     try:
-        # If name changed, create new profile and delete old one
-        if new_name != profile_name:
-            # Create new profile with selected servers
-            profile_config_manager.new_profile(new_name)
-
-            # Add selected servers to new profile (using efficient tagging)
-            for server_name in selected_servers:
-                profile_config_manager.add_server_to_profile(new_name, server_name)
-
-            # Delete old profile
-            profile_config_manager.delete_profile(profile_name)
-
-            console.print(f"[green]✅ Profile renamed from '[cyan]{profile_name}[/]' to '[cyan]{new_name}[/]'[/]")
-        else:
-            # Same name, just update servers
-            # Clear current servers
-            profile_config_manager.clear_profile(profile_name)
-
-            # Add selected servers (using efficient tagging)
-            for server_name in selected_servers:
-                profile_config_manager.add_server_to_profile(profile_name, server_name)
-
-            console.print(f"[green]✅ Profile '[cyan]{profile_name}[/]' updated[/]")
-
-        console.print(f"[green]✅ {len(selected_servers)} servers configured in profile[/]")
-
+        _apply_profile_changes(profile_config_manager, profile_name, new_name, selected_servers)
     except Exception as e:
         console.print(f"[red]Error updating profile: {e}[/]")
         return 1
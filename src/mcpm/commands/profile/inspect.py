@@ -1,28 +1,25 @@
 """Profile inspect command."""
 
+import os
 import shlex
+import signal
 import subprocess
 import sys
 
-from rich.console import Console
-from rich.panel import Panel
 
 from mcpm.profile.profile_config import ProfileConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.platform import NPX_CMD
 from mcpm.utils.rich_click_config import click
 
-console = Console()
-profile_config_manager = ProfileConfigManager()
+console = get_console()
 
 
 def build_profile_inspector_command(profile_name):
-    """Build the inspector command using mcpm profile run."""
+    """Build the inspector argv using mcpm profile run."""
     # Use mcpm profile run to start the FastMCP proxy - don't reinvent the wheel!
-    mcpm_profile_run_cmd = f"mcpm profile run {shlex.quote(profile_name)}"
-
-    # Build inspector command that uses mcpm profile run
-    inspector_cmd = f"{NPX_CMD} @modelcontextprotocol/inspector {mcpm_profile_run_cmd}"
-    return inspector_cmd
+    # Returned as an argv list so nothing needs quoting or re-splitting.
+    return [NPX_CMD, "@modelcontextprotocol/inspector", "mcpm", "profile", "run", profile_name]
 
 
 @click.command(name="inspect")
@@ -39,6 +36,10 @@ def inspect_profile(profile_name):
         mcpm profile inspect ai          # Inspect all servers in ai profile
         mcpm profile inspect data        # Inspect all servers in data profile
     """
+    from rich.panel import Panel
+
+    profile_config_manager = ProfileConfigManager()
+
     # Validate profile name
     if not profile_name or not profile_name.strip():
         console.print("[red]Error: Profile name cannot be empty[/]")
@@ -74,38 +75,58 @@ def inspect_profile(profile_name):
         console.print(f"  mcpm profile edit {profile_name}")
         sys.exit(1)
 
-    # Show profile info
+    # Show profile info in one print instead of a write per server
     server_count = len(profile_servers)
-    console.print(f"[dim]Profile contains {server_count} server(s):[/]")
-    for server_config in profile_servers:
-        console.print(f"  • [cyan]{server_config.name}[/]")
+    console.print(
+        f"[dim]Profile contains {server_count} server(s):[/]\n"
+        + "\n".join(f"  • [cyan]{server_config.name}[/]" for server_config in profile_servers)
+    )
 
-    console.print(f"\\n[bold]Starting Inspector for profile '[cyan]{profile_name}[/]'[/]")
-    console.print("The Inspector will show aggregated capabilities from all servers in the profile.")
-    console.print("The Inspector UI will open in your web browser.")
+    # Status blocks below are joined into single prints so each hits the
+    # terminal in one write
+    console.print(
+        f"\\n[bold]Starting Inspector for profile '[cyan]{profile_name}[/]'[/]\n"
+        "The Inspector will show aggregated capabilities from all servers in the profile.\n"
+        "The Inspector UI will open in your web browser."
+    )
 
     # Build inspector command using mcpm profile run
-    inspector_cmd = build_profile_inspector_command(profile_name)
+    cmd_parts = build_profile_inspector_command(profile_name)
 
     try:
-        console.print("[cyan]Starting MCPM Profile Inspector...[/]")
-        console.print("The Inspector UI will open in your web browser.")
-        console.print("[yellow]Press Ctrl+C to stop the Inspector.[/]")
+        console.print(
+            "[cyan]Starting MCPM Profile Inspector...[/]\n"
+            "The Inspector UI will open in your web browser.\n"
+            "[yellow]Press Ctrl+C to stop the Inspector.[/]"
+        )
 
-        # Split the command into components for subprocess
-        cmd_parts = shlex.split(inspector_cmd)
+        console.print(
+            f"[dim]Executing: {shlex.join(cmd_parts)}[/]\n"
+            "[bold green]Starting MCPM Profile Inspector...[/]\n"
+            "[cyan]Press Ctrl+C to exit[/]"
+        )
+        sys.stdout.flush()
 
+        # Execute the command with direct terminal access; Popen + wait()
+        # lets Ctrl+C be forwarded to the child deterministically instead of
+        # relying on subprocess.call's blocking wait
+        process = subprocess.Popen(cmd_parts)
         try:
-            console.print(f"[dim]Executing: {inspector_cmd}[/]")
-            console.print("[bold green]Starting MCPM Profile Inspector...[/]")
-            console.print("[cyan]Press Ctrl+C to exit[/]")
-            sys.stdout.flush()
-
-            # Execute the command with direct terminal access
-            returncode = subprocess.call(cmd_parts)
-
+            returncode = process.wait()
         except KeyboardInterrupt:
             console.print("\\n[bold yellow]Inspector process terminated by keyboard interrupt.[/]")
+            # POSIX delivers the terminal's SIGINT to the whole foreground
+            # process group, so this just nudges a child that missed it;
+            # Windows Popen rejects SIGINT, so fall back to terminate()
+            if os.name == "nt":
+                process.terminate()
+            else:
+                process.send_signal(signal.SIGINT)
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
             returncode = 130
 
         # Check exit code
@@ -2,11 +2,17 @@
 
 import sys
 
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
-from rich.console import Console
+from mcpm.utils.console import get_console
 
-console = Console()
+console = get_console()
+
+
+def _command_label(server_config):
+    """Short command string for a server choice label."""
+    command = getattr(server_config, "command", "custom")
+    if isinstance(command, (list, tuple)):
+        return " ".join(str(x) for x in command)
+    return str(command)
 
 
 def interactive_profile_edit(profile_name: str, all_servers: dict, current_servers: set):
@@ -17,45 +23,42 @@ def interactive_profile_edit(profile_name: str, all_servers: dict, current_serve
         console.print("[dim]Use --name and --servers options for non-interactive editing[/]")
         return None
 
+    # Deferred so the non-tty fallback above never pays the InquirerPy
+    # import cost
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+
     try:
-        # Build server choices in a single loop
-        server_choices = []
-        for server_name, server_config in all_servers.items():
-            command = getattr(server_config, "command", "custom")
-            if hasattr(command, "__iter__") and not isinstance(command, str):
-                command = " ".join(str(x) for x in command)
-
-            # Set enabled=True only for servers that are currently in the profile
-            is_currently_in_profile = server_name in current_servers
-            server_choices.append(
-                Choice(value=server_name, name=f"{server_name} ({command})", enabled=is_currently_in_profile)
+        # Build server choices in a single pass; enabled marks servers that
+        # are currently in the profile
+        server_choices = [
+            Choice(
+                value=server_name,
+                name=f"{server_name} ({_command_label(server_config)})",
+                enabled=server_name in current_servers,
             )
+            for server_name, server_config in all_servers.items()
+        ]
+
+        # InquirerPy prompts read stdin via prompt_toolkit and never consult
+        # sys.argv, so no argv save/restore is needed around them
+
+        # Get profile name first
+        new_name = inquirer.text(
+            message="Profile name:",
+            default=profile_name,
+            validate=lambda text: len(text.strip()) > 0,
+            keybindings={"interrupt": [{"key": "escape"}]},  # Map ESC to interrupt
+        ).execute()
+
+        # Then get server selection with proper defaults
+        selected_servers = inquirer.checkbox(
+            message="Select servers to include in this profile:",
+            choices=server_choices,
+            keybindings={"interrupt": [{"key": "escape"}]},  # Map ESC to interrupt
+        ).execute()
 
-        # Clear any remaining command line arguments to avoid conflicts
-        original_argv = sys.argv[:]
-        sys.argv = [sys.argv[0]]  # Keep only script name
-
-        try:
-            # Get profile name first
-            new_name = inquirer.text(
-                message="Profile name:",
-                default=profile_name,
-                validate=lambda text: len(text.strip()) > 0,
-                keybindings={"interrupt": [{"key": "escape"}]},  # Map ESC to interrupt
-            ).execute()
-
-            # Then get server selection with proper defaults
-            selected_servers = inquirer.checkbox(
-                message="Select servers to include in this profile:",
-                choices=server_choices,
-                keybindings={"interrupt": [{"key": "escape"}]},  # Map ESC to interrupt
-            ).execute()
-
-            answers = {"name": new_name, "servers": selected_servers}
-
-        finally:
-            # Restore original argv
-            sys.argv = original_argv
+        answers = {"name": new_name, "servers": selected_servers}
 
         if not answers:
             return {"cancelled": True}
@@ -1,14 +1,10 @@
 """Profile list command."""
 
-from rich.console import Console
-from rich.table import Table
-
-from mcpm.core.schema import CustomServerConfig, STDIOServerConfig
 from mcpm.profile.profile_config import ProfileConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.rich_click_config import click
 
-console = Console()
-profile_config_manager = ProfileConfigManager()
+console = get_console()
 
 
 @click.command(name="ls")
@@ -16,28 +12,32 @@ profile_config_manager = ProfileConfigManager()
 @click.help_option("-h", "--help")
 def list_profiles(verbose=False):
     """List all MCPM profiles."""
+    from rich.table import Table
+
+    profile_config_manager = ProfileConfigManager()
+
     profiles = profile_config_manager.list_profiles()
     if not profiles:
         console.print("\\n[yellow]No profiles found.[/]\\n")
         return
     console.print(f"\\n[green]Found {len(profiles)} profile(s)[/]\\n")
     table = Table(show_header=True, header_style="bold")
-    table.add_column("Name", style="cyan")
+    # Fixed Name width from a cheap pre-pass spares Rich its per-cell
+    # measurement for that column on long listings
+    name_width = max(max((len(name) for name in profiles), default=0), len("Name"))
+    table.add_column("Name", style="cyan", width=name_width, no_wrap=True)
     table.add_column("Servers", overflow="fold")
     if verbose:
         table.add_column("Server Details", overflow="fold")
-    for profile_name, configs in profiles.items():
-        server_names = [config.name for config in configs]
-        row = [profile_name, ", ".join(server_names)]
-        if verbose:
-            details = []
-            for config in configs:
-                if isinstance(config, STDIOServerConfig):
-                    details.append(f"{config.name}: {config.command} {' '.join(config.args)}")
-                elif isinstance(config, CustomServerConfig):
-                    details.append(f"{config.name}: Custom")
-                else:
-                    details.append(f"{config.name}: {config.url}")
-            row.append("\\n".join(details))
+    # Verbose check hoisted out of the loop; rows are built in one
+    # comprehension before rendering
+    if verbose:
+        rows = [
+            (name, ", ".join(c.name for c in configs), "\\n".join(c.summary() for c in configs))
+            for name, configs in profiles.items()
+        ]
+    else:
+        rows = [(name, ", ".join(c.name for c in configs)) for name, configs in profiles.items()]
+    for row in rows:
         table.add_row(*row)
     console.print(table)
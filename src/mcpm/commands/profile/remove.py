@@ -1,14 +1,8 @@
 """Profile remove command."""
 
-from rich.console import Console
-from rich.prompt import Confirm
-
 from mcpm.profile.profile_config import ProfileConfigManager
 from mcpm.utils.rich_click_config import click
 
-console = Console()
-profile_config_manager = ProfileConfigManager()
-
 
 @click.command(name="rm")
 @click.argument("profile_name")
@@ -26,41 +20,44 @@ def remove_profile(profile_name, force):
         mcpm profile rm old-profile         # Remove with confirmation
         mcpm profile rm old-profile --force # Remove without confirmation
     """
-    # Check if profile exists
-    if profile_config_manager.get_profile(profile_name) is None:
-        console.print(f"[red]Error: Profile '[bold]{profile_name}[/]' not found[/]")
-        console.print()
-        console.print("[yellow]Available options:[/]")
-        console.print("  • Run 'mcpm profile ls' to see available profiles")
-        return 1
+    profile_config_manager = ProfileConfigManager()
 
-    # Get profile info for confirmation
+    # Single lookup doubles as existence check and confirmation data
     profile_servers = profile_config_manager.get_profile(profile_name)
-    server_count = len(profile_servers) if profile_servers else 0
+    if profile_servers is None:
+        click.secho(f"Error: Profile '{profile_name}' not found", fg="red")
+        click.echo()
+        click.secho("Available options:", fg="yellow")
+        click.echo("  • Run 'mcpm profile ls' to see available profiles")
+        return 1
+
+    server_count = len(profile_servers)
 
     # Confirmation (unless forced)
     if not force:
-        console.print(f"[yellow]About to remove profile '[bold]{profile_name}[/]'[/]")
+        click.secho(f"About to remove profile '{profile_name}'", fg="yellow")
         if server_count > 0:
-            console.print(f"[dim]This profile contains {server_count} server(s)[/]")
-            console.print("[dim]The servers will remain in global configuration[/]")
-        console.print()
+            click.secho(f"This profile contains {server_count} server(s)", dim=True)
+            click.secho("The servers will remain in global configuration", dim=True)
+        click.echo()
+
+        from rich.prompt import Confirm
 
         confirm_removal = Confirm.ask("Are you sure you want to remove this profile?", default=False)
 
         if not confirm_removal:
-            console.print("[yellow]Profile removal cancelled[/]")
+            click.secho("Profile removal cancelled", fg="yellow")
             return 0
 
     # Remove the profile
     success = profile_config_manager.delete_profile(profile_name)
 
     if success:
-        console.print(f"[green]✅ Profile '[cyan]{profile_name}[/]' removed successfully[/]")
+        click.secho(f"✅ Profile '{profile_name}' removed successfully", fg="green")
         if server_count > 0:
-            console.print(f"[dim]{server_count} server(s) remain available in global configuration[/]")
+            click.secho(f"{server_count} server(s) remain available in global configuration", dim=True)
     else:
-        console.print(f"[red]Error removing profile '[bold]{profile_name}[/]'[/]")
+        click.secho(f"Error removing profile '{profile_name}'", fg="red")
         return 1
 
     return 0
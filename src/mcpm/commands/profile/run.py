@@ -1,16 +1,11 @@
 """Profile run command."""
 
-import asyncio
 import logging
 
-from rich.console import Console
-from rich.panel import Panel
-
-from mcpm.fastmcp_integration.proxy import create_mcpm_proxy
-
 # Removed SessionAction import - using strings directly
 from mcpm.profile.profile_config import ProfileConfigManager
 from mcpm.utils.config import DEFAULT_PORT
+from mcpm.utils.console import get_console
 from mcpm.utils.logging_config import (
     ensure_dependency_logging_suppressed,
     get_uvicorn_log_level,
@@ -18,35 +13,100 @@ from mcpm.utils.logging_config import (
 )
 from mcpm.utils.rich_click_config import click
 
-profile_config_manager = ProfileConfigManager()
 logger = logging.getLogger(__name__)
-console = Console()
+console = get_console()
+
+# Dependency logging only needs configuring once per process, even when a
+# supervisor respawns profiles through this module repeatedly
+_dependency_logging_configured = False
+
+
+def _validate_run_options(profile_name, http, sse):
+    """Return an error message for invalid arguments, or None when valid."""
+    if not profile_name or not profile_name.strip():
+        return "Profile name cannot be empty"
+    if http and sse:
+        return "Error: Cannot use both --http and --sse flags together"
+    return None
 
 
-async def find_available_port(preferred_port, max_attempts=10):
-    """Find an available port starting from preferred_port."""
+async def find_available_port(preferred_port):
+    """Find an available port, preferring preferred_port.
+
+    Tries the preferred port once, then binds to port 0 and lets the kernel
+    assign a free one — two syscall round-trips in the worst case instead of
+    probing candidate ports one by one. SO_REUSEADDR avoids false negatives
+    from sockets lingering in TIME_WAIT; on Windows the option instead
+    allows binding over a live listener, so it is POSIX-only.
+    """
+    import os
     import socket
 
-    for attempt in range(max_attempts):
-        port_to_try = preferred_port + attempt
+    reuse_addr = os.name != "nt"
 
-        # Check if port is available
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("127.0.0.1", port_to_try))
-                return port_to_try
-        except OSError:
-            continue  # Port is busy, try next one
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if reuse_addr:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(("127.0.0.1", preferred_port))
+            return preferred_port
+    except OSError:
+        pass  # Preferred port is busy, let the kernel pick one
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        if reuse_addr:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _run_single_stdio(server_config):
+    """Run one STDIO server directly, bypassing the aggregation proxy.
+
+    The child inherits our stdio and speaks MCP straight to the client, so
+    no message pays the proxy's per-request middleware cost. Trade-off:
+    usage tracking lives in the proxy middleware and is skipped here.
+    """
+    import asyncio
+    import os
+
+    command = [server_config.command, *(server_config.args or [])]
+    # Mirror the env the proxy would hand to FastMCP's stdio transport
+    env = os.environ.copy()
+    env["MCPM_STDIO_SERVER"] = "true"
+    if server_config.env:
+        env.update(server_config.env)
 
-    # If no port found, return the original (will likely fail but user will see the error)
-    return preferred_port
+    logger.debug(f"Running '{server_config.name}' directly over stdio: {command}")
+    process = await asyncio.create_subprocess_exec(*command, env=env)
+    return await process.wait()
 
 
 async def run_profile_fastmcp(
     profile_servers, profile_name, http_mode=False, sse_mode=False, port=DEFAULT_PORT, host="127.0.0.1"
 ):
     """Run profile servers using FastMCP proxy for proper aggregation."""
+    # Deferred so mcpm profile --help doesn't pay the fastmcp import cost
+    from rich.panel import Panel
+
+    from mcpm.core.schema import STDIOServerConfig
+    from mcpm.fastmcp_integration.proxy import create_mcpm_proxy
+
+    # Fast path: a single stdio server needs no aggregation or namespacing,
+    # so skip the proxy layer entirely
+    if not (http_mode or sse_mode) and len(profile_servers) == 1 and isinstance(profile_servers[0], STDIOServerConfig):
+        try:
+            return await _run_single_stdio(profile_servers[0])
+        except KeyboardInterrupt:
+            logger.info("Profile execution interrupted")
+            return 130
+        except Exception as e:
+            logger.error(f"Error running profile '{profile_name}': {e}")
+            return 1
+
     server_count = len(profile_servers)
+    # Computed once; reused by the debug log and the panel server list
+    server_names = [s.name for s in profile_servers]
     logger.debug(f"Using FastMCP proxy to aggregate {server_count} server(s)")
     mode = "SSE" if sse_mode else "HTTP" if http_mode else "stdio"
     logger.debug(f"Mode: {mode}")
@@ -68,13 +128,15 @@ async def run_profile_fastmcp(
             profile_name=profile_name,
         )
 
-        logger.debug(f"FastMCP proxy initialized with: {[s.name for s in profile_servers]}")
-
-        # Set up dependency logging for FastMCP/MCP libraries
-        setup_dependency_logging()
+        logger.debug(f"FastMCP proxy initialized with: {server_names}")
 
-        # Re-suppress library logging after FastMCP initialization
-        ensure_dependency_logging_suppressed()
+        # Set up dependency logging for FastMCP/MCP libraries, then
+        # re-suppress after FastMCP initialization — once per process
+        global _dependency_logging_configured
+        if not _dependency_logging_configured:
+            setup_dependency_logging()
+            ensure_dependency_logging_suppressed()
+            _dependency_logging_configured = True
 
         # Note: Usage tracking is handled by proxy middleware
 
@@ -93,7 +155,7 @@ async def run_profile_fastmcp(
                 title = "📁 Profile Running Locally"
 
             # Build server list
-            server_list = "\n".join([f"  • [cyan]{server.name}[/]" for server in profile_servers])
+            server_list = "\n".join(f"  • [cyan]{name}[/]" for name in server_names)
 
             panel_content = f"[bold]Profile:[/] {profile_name}\n[bold]URL:[/] [cyan]{server_url}[/cyan]\n\n[bold]Servers:[/]\n{server_list}\n\n[dim]Press Ctrl+C to stop the profile[/]"
 
@@ -156,21 +218,17 @@ def run(profile_name, http, sse, port, host):
 
     Debug logging: Set MCPM_DEBUG=1 for verbose output
     """
-    # Validate profile name
-    if not profile_name or not profile_name.strip():
-        logger.error("Profile name cannot be empty")
+    # Validate arguments in one place before doing any real work
+    error = _validate_run_options(profile_name, http, sse)
+    if error:
+        logger.error(error)
         return 1
 
     profile_name = profile_name.strip()
 
-    # Validate mutually exclusive options
-    if http and sse:
-        logger.error("Error: Cannot use both --http and --sse flags together")
-        return 1
-
     # Check if profile exists
     try:
-        profile_servers = profile_config_manager.get_profile(profile_name)
+        profile_servers = ProfileConfigManager().get_profile(profile_name)
         if profile_servers is None:
             logger.error(f"Profile '{profile_name}' not found")
             logger.info("Available options:")
@@ -201,6 +259,16 @@ def run(profile_name, http, sse, port, host):
     if http or sse:
         logger.debug(f"Port: {port}")
 
+    # Deferred so validation failures above never pay the asyncio import
+    import asyncio
+
+    try:  # optional faster event loop, mainly for HTTP/SSE serving
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the async function
     return asyncio.run(
         run_profile_fastmcp(profile_servers, profile_name, http_mode=http, sse_mode=sse, port=port, host=host)
@@ -1,64 +1,96 @@
 """Profile share command."""
 
 import asyncio
+import functools
 import logging
 import secrets
 
-from rich.console import Console
-from rich.panel import Panel
 
-from mcpm.core.tunnel import Tunnel
-from mcpm.fastmcp_integration.proxy import create_mcpm_proxy
 from mcpm.profile.profile_config import ProfileConfigManager
 from mcpm.utils.config import DEFAULT_PORT, DEFAULT_SHARE_ADDRESS
+from mcpm.utils.console import get_console
 from mcpm.utils.logging_config import (
     ensure_dependency_logging_suppressed,
     get_uvicorn_log_level,
     setup_dependency_logging,
 )
+from mcpm.utils.network import find_available_port
 from mcpm.utils.rich_click_config import click
 
-console = Console()
-profile_config_manager = ProfileConfigManager()
+console = get_console()
 logger = logging.getLogger(__name__)
 
+# Strong references to running server tasks; the event loop only keeps weak
+# ones, so a task held solely in a local could be garbage-collected mid-run
+_server_tasks = set()
 
-async def find_available_port(preferred_port, max_attempts=10):
-    """Find an available port starting from preferred_port."""
-    import socket
 
-    for attempt in range(max_attempts):
-        port_to_try = preferred_port + attempt
+@functools.lru_cache(maxsize=1)
+def _get_or_create_api_key():
+    """Load the share API key, generating and persisting one if missing.
 
-        # Check if port is available
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("127.0.0.1", port_to_try))
-                return port_to_try
-        except OSError:
-            continue  # Port is busy, try next one
+    Memoized for the process lifetime so repeated shares skip the config
+    read (and occasional write) on the startup path.
+    """
+    from mcpm.utils.config import ConfigManager
+
+    config_manager = ConfigManager()
+    api_key = config_manager.get_auth_config().get("api_key")
+    if not api_key:
+        api_key = secrets.token_urlsafe(32)
+        config_manager.save_auth_config(api_key)
+        console.print(f"[green]Generated new API key:[/] [cyan]{api_key}[/]")
+    return api_key
 
-    # If no port found, return the original (will likely fail but user will see the error)
-    return preferred_port
+
+async def _wait_ready(port, server_task, timeout=3.0):
+    """Wait until the local HTTP server accepts connections.
+
+    Polls the port instead of sleeping a fixed interval, so the tunnel comes
+    up as soon as uvicorn is listening. If the server task dies first, its
+    exception is re-raised here rather than surfacing as a tunnel failure.
+    """
+    deadline = asyncio.get_event_loop().time() + timeout
+    while asyncio.get_event_loop().time() < deadline:
+        if server_task.done():
+            server_task.result()  # Raise the server's failure, if any
+            return
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", port), 0.1)
+        except (ConnectionRefusedError, OSError, asyncio.TimeoutError):
+            await asyncio.sleep(0.02)
+        else:
+            writer.close()
+            return
 
 
 async def share_profile_fastmcp(profile_servers, profile_name, port, address, http, no_auth):
     """Share profile servers using FastMCP proxy + tunnel."""
-    api_key = None
-    if not no_auth:
-        from mcpm.utils.config import ConfigManager
-
-        config_manager = ConfigManager()
-        auth_config = config_manager.get_auth_config()
-        api_key = auth_config.get("api_key")
-        if not api_key:
-            api_key = secrets.token_urlsafe(32)
-            config_manager.save_auth_config(api_key)
-            console.print(f"[green]Generated new API key:[/] [cyan]{api_key}[/]")
+    # Deferred so mcpm profile --help doesn't pay the fastmcp/tunnel import cost
+    from rich.panel import Panel
+
+    from mcpm.core.tunnel import Tunnel
+    from mcpm.fastmcp_integration.proxy import create_mcpm_proxy
+
+    port_task = None
+    frpc_task = None
     try:
         server_count = len(profile_servers)
         logger.debug(f"Creating FastMCP proxy for profile '{profile_name}' with {server_count} server(s)")
 
+        # The port scan has no data dependency on the proxy or API key, so
+        # kick it off first and let it overlap the slower setup below
+        preferred_port = port or DEFAULT_PORT
+        port_task = asyncio.create_task(find_available_port(preferred_port))
+
+        # Pre-warm the tunnel binary too: on a cold start start_tunnel()
+        # would otherwise download and checksum frpc serially after the
+        # server is already up
+        frpc_task = asyncio.create_task(asyncio.to_thread(Tunnel.download_binary))
+
+        # Key lookup hits the config file; run it off the loop while the scan runs
+        api_key = None if no_auth else await asyncio.to_thread(_get_or_create_api_key)
+
         # Create FastMCP proxy for profile servers (HTTP mode - disable auth)
         proxy = await create_mcpm_proxy(
             servers=profile_servers,
@@ -76,9 +108,8 @@ async def share_profile_fastmcp(profile_servers, profile_name, port, address, ht
         # Re-suppress library logging after FastMCP initialization
         ensure_dependency_logging_suppressed()
 
-        # Use default port if none specified, then find available port
-        preferred_port = port or DEFAULT_PORT
-        actual_port = await find_available_port(preferred_port)
+        # Collect the port scan started before proxy creation
+        actual_port = await port_task
         if actual_port != preferred_port:
             logger.debug(f"Port {preferred_port} is busy, using port {actual_port} instead")
 
@@ -90,40 +121,51 @@ async def share_profile_fastmcp(profile_servers, profile_name, port, address, ht
                 host="127.0.0.1", port=actual_port, uvicorn_config={"log_level": get_uvicorn_log_level()}
             )
         )
+        _server_tasks.add(server_task)
+        server_task.add_done_callback(_server_tasks.discard)
 
-        # Wait a moment for server to start
-        await asyncio.sleep(2)
+        tunnel = None
+        try:
+            # Wait for the server to accept connections before creating the tunnel
+            await _wait_ready(actual_port, server_task)
 
-        logger.debug(f"FastMCP proxy running on port {actual_port}")
+            logger.debug(f"FastMCP proxy running on port {actual_port}")
 
-        # Create tunnel to make it publicly accessible
-        if not address:
-            address = DEFAULT_SHARE_ADDRESS
+            # Create tunnel to make it publicly accessible
+            if not address:
+                address = DEFAULT_SHARE_ADDRESS
 
-        remote_host, remote_port = address.split(":")
-        logger.debug(f"Creating tunnel from localhost:{actual_port} to {remote_host}:{remote_port}")
+            remote_host, remote_port = address.split(":")
+            logger.debug(f"Creating tunnel from localhost:{actual_port} to {remote_host}:{remote_port}")
 
-        # Generate a random share token
-        share_token = secrets.token_urlsafe(32)
+            # Generate a random share token
+            share_token = secrets.token_urlsafe(32)
 
-        tunnel = Tunnel(
-            remote_host=remote_host,
-            remote_port=int(remote_port),
-            local_host="localhost",
-            local_port=actual_port,
-            share_token=share_token,
-            http=http,
-            share_server_tls_certificate=None,
-        )
+            # Surface any download failure here, before starting the tunnel
+            await frpc_task
 
-        public_url = tunnel.start_tunnel()
+            tunnel = Tunnel(
+                remote_host=remote_host,
+                remote_port=int(remote_port),
+                local_host="localhost",
+                local_port=actual_port,
+                share_token=share_token,
+                http=http,
+                share_server_tls_certificate=None,
+            )
+
+            public_url = tunnel.start_tunnel()
+
+            if not public_url:
+                console.print("[red]Failed to create tunnel[/]")
+                logger.error("Failed to create tunnel")
+                return 1
 
-        if public_url:
             # Display critical information in a nice panel
             http_url = f"{public_url}/mcp/"
 
             # Build server list
-            server_list = "\n".join([f"  • [cyan]{server.name}[/]" for server in profile_servers])
+            server_list = "\n".join(f"  • [cyan]{server.name}[/]" for server in profile_servers)
 
             # Build panel content based on auth status
             panel_content = f"[bold]Profile:[/] {profile_name}\n[bold]URL:[/] [cyan]{http_url}[/cyan]\n"
@@ -149,18 +191,16 @@ async def share_profile_fastmcp(profile_servers, profile_name, port, address, ht
                 await server_task
             except asyncio.CancelledError:
                 pass
-            finally:
-                if tunnel:
-                    tunnel.kill()
-        else:
-            console.print("[red]Failed to create tunnel[/]")
-            logger.error("Failed to create tunnel")
-            server_task.cancel()
-            # Wait for cancellation to complete
-            await asyncio.gather(server_task, return_exceptions=True)
-            return 1
 
-        return 0
+            return 0
+        finally:
+            # Always tear down the tunnel and the uvicorn task, whichever
+            # path we exit through, so Ctrl+C never orphans the server
+            if tunnel:
+                tunnel.kill()
+            if not server_task.done():
+                server_task.cancel()
+                await asyncio.gather(server_task, return_exceptions=True)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopping...[/]")
@@ -169,6 +209,14 @@ async def share_profile_fastmcp(profile_servers, profile_name, port, address, ht
         console.print(f"[red]Error: {e}[/]")
         logger.exception("Detailed error information")
         return 1
+    finally:
+        # On the success path both pre-warm tasks were already awaited; on
+        # error paths reap them here so the in-flight frpc download doesn't
+        # block asyncio.run's shutdown until its 30 s timeout expires
+        for task in (port_task, frpc_task):
+            if task is not None and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
 
 
 @click.command(name="share")
@@ -193,7 +241,7 @@ def share_profile(profile_name, port, address, http, no_auth):
         mcpm profile share ai --port 5000    # Share ai profile on specific port
     """
     # Check if profile exists
-    profile_servers = profile_config_manager.get_profile(profile_name)
+    profile_servers = ProfileConfigManager().get_profile(profile_name)
     if profile_servers is None:
         console.print(f"[red]Error: Profile '[bold]{profile_name}[/]' not found[/]")
         console.print()
@@ -4,24 +4,23 @@ import asyncio
 import logging
 import sys
 
-from rich.console import Console
-from rich.panel import Panel
-
 from mcpm.fastmcp_integration.proxy import create_mcpm_proxy
 from mcpm.global_config import GlobalConfigManager
 
 # Removed SessionAction import - using strings directly
 from mcpm.utils.config import DEFAULT_PORT
+from mcpm.utils.console import get_console
 from mcpm.utils.logging_config import (
     ensure_dependency_logging_suppressed,
     get_uvicorn_log_level,
     setup_dependency_logging,
 )
+from mcpm.utils.network import find_available_port
 from mcpm.utils.rich_click_config import click
 
 global_config_manager = GlobalConfigManager()
 logger = logging.getLogger(__name__)
-console = Console()
+console = get_console()
 
 
 def find_installed_server(server_name):
@@ -36,6 +35,9 @@ async def run_server_with_fastmcp(
     server_config, server_name, http_mode=False, sse_mode=False, port=None, host="127.0.0.1"
 ):
     """Run server using FastMCP proxy (stdio or HTTP)."""
+    # Deferred so other subcommands don't pay the rich.panel import
+    from rich.panel import Panel
+
     try:
         # Use default port if none specified
         if port is None:
@@ -110,25 +112,6 @@ async def run_server_with_fastmcp(
         return 1
 
 
-async def find_available_port(preferred_port, max_attempts=10):
-    """Find an available port starting from preferred_port."""
-    import socket
-
-    for attempt in range(max_attempts):
-        port_to_try = preferred_port + attempt
-
-        # Check if port is available
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("127.0.0.1", port_to_try))
-                return port_to_try
-        except OSError:
-            continue  # Port is busy, try next one
-
-    # If no port found, return the original (will likely fail but user will see the error)
-    return preferred_port
-
-
 @click.command()
 @click.argument("server_name")
 @click.option("--http", is_flag=True, help="Run server over HTTP instead of stdio")
@@ -8,23 +8,22 @@ import secrets
 import sys
 from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-
 from mcpm.core.tunnel import Tunnel
 from mcpm.fastmcp_integration.proxy import create_mcpm_proxy
 from mcpm.global_config import GlobalConfigManager
 
 # Removed SessionAction import - using strings directly
 from mcpm.utils.config import DEFAULT_PORT, DEFAULT_SHARE_ADDRESS
+from mcpm.utils.console import get_console
 from mcpm.utils.logging_config import (
     ensure_dependency_logging_suppressed,
     get_uvicorn_log_level,
     setup_dependency_logging,
 )
+from mcpm.utils.network import find_available_port
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 global_config_manager = GlobalConfigManager()
 logger = logging.getLogger(__name__)
 
@@ -37,25 +36,6 @@ def find_installed_server(server_name):
     return None, None
 
 
-async def find_available_port(preferred_port, max_attempts=10):
-    """Find an available port starting from preferred_port."""
-    import socket
-
-    for attempt in range(max_attempts):
-        port_to_try = preferred_port + attempt
-
-        # Check if port is available
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("127.0.0.1", port_to_try))
-                return port_to_try
-        except OSError:
-            continue  # Port is busy, try next one
-
-    # If no port found, return the original (will likely fail but user will see the error)
-    return preferred_port
-
-
 async def start_fastmcp_proxy(
     server_config, server_name, port: Optional[int] = None, auth_enabled: bool = True, api_key: Optional[str] = None
 ) -> int:
@@ -181,6 +161,8 @@ def share(server_name, port, address, http, timeout, retry, no_auth):
 
 async def _share_async(server_config, server_name, port, remote_host, remote_port, http, timeout, retry, no_auth):
     """Async function to handle sharing with FastMCP proxy."""
+    # Deferred so other subcommands don't pay the rich.panel import
+    from rich.panel import Panel
 
     proxy = None
     tunnel = None
@@ -2,14 +2,12 @@
 Uninstall command for removing MCP servers from global configuration
 """
 
-from rich.console import Console
-from rich.prompt import Confirm
-
 from mcpm.global_config import GlobalConfigManager
+from mcpm.utils.console import get_console
 from mcpm.utils.display import print_server_config
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 global_config_manager = GlobalConfigManager()
 
 
@@ -60,6 +58,9 @@ def uninstall(server_name, force):
 
     # Get confirmation if --force is not used
     if not force:
+        # Deferred so the --force path skips the rich.prompt import
+        from rich.prompt import Confirm
+
         console.print(f"\n[bold yellow]Are you sure you want to remove:[/] {server_name}")
         console.print("[italic]To bypass this confirmation, use --force[/]")
         # Use Rich's Confirm for a better user experience
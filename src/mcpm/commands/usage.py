@@ -3,14 +3,11 @@
 import asyncio
 from datetime import datetime
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
 from mcpm.monitor import get_monitor
+from mcpm.utils.console import get_console
 from mcpm.utils.rich_click_config import click
 
-console = Console()
+console = get_console()
 
 
 async def get_usage_stats_async(days: int, server_name: str = None, profile_name: str = None):
@@ -73,6 +70,8 @@ def usage(days, server, profile):
 
 def show_server_usage(stats, server_name: str):
     """Show detailed usage for a specific server."""
+    from rich.panel import Panel
+
     if not stats:
         console.print(f"[yellow]No usage data found for server '[bold]{server_name}[/]'[/]")
         console.print("[dim]Usage data is collected when servers are run via 'mcpm run'[/]")
@@ -107,6 +106,8 @@ def show_server_usage(stats, server_name: str):
 
 def show_profile_usage(stats, profile_name: str):
     """Show detailed usage for a specific profile."""
+    from rich.panel import Panel
+
     if not stats:
         console.print(f"[yellow]No usage data found for profile '[bold]{profile_name}[/]'[/]")
         console.print("[dim]Usage data is collected when profiles are run via 'mcpm profile run'[/]")
@@ -130,6 +131,9 @@ def show_profile_usage(stats, profile_name: str):
 
 def show_usage_overview(stats, days: int):
     """Show comprehensive usage overview."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     if not stats.servers and not stats.profiles and not stats.recent_sessions:
         console.print("[yellow]No usage data available yet.[/]")
         console.print("[dim]Usage data is collected automatically when servers are used via MCPM.[/]")
@@ -255,19 +259,33 @@ def show_usage_overview(stats, days: int):
                 origin_counts[origin] = origin_counts.get(origin, 0) + 1
                 transport_counts[transport] = transport_counts.get(transport, 0) + 1
 
-        console.print("[bold cyan]📋 Activity Breakdown[/]")
-        for action, count in sorted(action_counts.items(), key=lambda x: x[1], reverse=True):
-            console.print(f"  [green]{action}:[/] {count} operations")
+        # Each section rendered with a single print so Rich lays out and
+        # writes once per block instead of once per row
+        console.print(
+            "[bold cyan]📋 Activity Breakdown[/]\n"
+            + "\n".join(
+                f"  [green]{action}:[/] {count} operations"
+                for action, count in sorted(action_counts.items(), key=lambda x: x[1], reverse=True)
+            )
+        )
 
         if origin_counts:
-            console.print("\n[bold cyan]🌐 Request Origins[/]")
-            for origin, count in sorted(origin_counts.items(), key=lambda x: x[1], reverse=True):
-                console.print(f"  [blue]{origin}:[/] {count} requests")
+            console.print(
+                "\n[bold cyan]🌐 Request Origins[/]\n"
+                + "\n".join(
+                    f"  [blue]{origin}:[/] {count} requests"
+                    for origin, count in sorted(origin_counts.items(), key=lambda x: x[1], reverse=True)
+                )
+            )
 
         if transport_counts:
-            console.print("\n[bold cyan]🚀 Transport Types[/]")
-            for transport, count in sorted(transport_counts.items(), key=lambda x: x[1], reverse=True):
-                console.print(f"  [magenta]{transport}:[/] {count} sessions")
+            console.print(
+                "\n[bold cyan]🚀 Transport Types[/]\n"
+                + "\n".join(
+                    f"  [magenta]{transport}:[/] {count} sessions"
+                    for transport, count in sorted(transport_counts.items(), key=lambda x: x[1], reverse=True)
+                )
+            )
 
 
 def format_duration(duration_ms):
@@ -30,6 +30,10 @@ class STDIOServerConfig(BaseServerConfig):
     args: List[str] = []
     env: Dict[str, str] = {}
 
+    def summary(self) -> str:
+        """One-line description for listings."""
+        return f"{self.name}: {self.command} {' '.join(self.args)}"
+
     def get_filtered_env_vars(self, env: Dict[str, str]) -> Dict[str, str]:
         """Get filtered environment variables with empty values removed
 
@@ -72,6 +76,10 @@ class RemoteServerConfig(BaseServerConfig):
     url: str
     headers: Dict[str, Any] = {}
 
+    def summary(self) -> str:
+        """One-line description for listings."""
+        return f"{self.name}: {self.url}"
+
     def to_mcp_proxy_stdio(self) -> STDIOServerConfig:
         proxy_args = [
             "mcp-proxy",
@@ -108,6 +116,10 @@ class CustomServerConfig(BaseServerConfig):
 
     config: Dict[str, Any]
 
+    def summary(self) -> str:
+        """One-line description for listings."""
+        return f"{self.name}: Custom"
+
 
 ServerConfig = Union[STDIOServerConfig, RemoteServerConfig, CustomServerConfig]
 
@@ -2,6 +2,7 @@ import hashlib
 import os
 import platform
 import re
+import select
 import stat
 import subprocess
 import sys
@@ -46,8 +47,8 @@ CHECKSUMS = {
 CHUNK_SIZE = 128
 
 BINARY_FILENAME = f"{BINARY_REMOTE_NAME}_v{VERSION}"
+# download_binary() creates this directory on demand; no mkdir at import time
 BINARY_FOLDER = get_frpc_directory()
-BINARY_FOLDER.mkdir(parents=True, exist_ok=True)
 BINARY_PATH = str(BINARY_FOLDER / BINARY_FILENAME)
 
 TUNNEL_TIMEOUT_SECONDS = 30
@@ -116,6 +117,14 @@ class Tunnel:
         if self.proc is not None:
             print(f"Killing tunnel {self.local_host}:{self.local_port} <> {self.url}")
             self.proc.terminate()
+            # Confirm the exit rather than assuming SIGTERM landed; escalate
+            # to SIGKILL so a wedged frpc can't outlive us, and reap either
+            # way to avoid leaving a zombie
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
             self.proc = None
 
     def _start_tunnel(self, binary: str) -> str:
@@ -160,31 +169,62 @@ class Tunnel:
             print(log_text, file=sys.stderr)
             raise ValueError(f"{TUNNEL_ERROR_MESSAGE}\n{log_text}")
 
-        while url == "":
-            # check for timeout and log
-            if time.time() - start_timestamp >= TUNNEL_TIMEOUT_SECONDS:
-                _raise_tunnel_error()
-
-            assert self.proc is not None  # noqa: S101
-            if self.proc.stdout is None:
-                continue
-
-            line = self.proc.stdout.readline()
-            line = line.decode("utf-8")
-
-            if line == "":
-                continue
-
+        def _consume_line(line: str) -> str:
+            """Record one frpc log line; return the URL if it carries one."""
             log.append(line.strip())
 
             if "start proxy success" in line:
                 result = re.search("start proxy success: (.+)\n", line)
                 if result is None:
                     _raise_tunnel_error()
-                else:
-                    url = result.group(1)
+                return result.group(1)
             elif "login to server failed" in line:
                 _raise_tunnel_error()
+            return ""
+
+        assert self.proc is not None and self.proc.stdout is not None  # noqa: S101
+
+        if os.name == "nt":
+            # Windows pipes support neither os.set_blocking (before 3.12)
+            # nor select(), so fall back to blocking reads; the timeout is
+            # only checked between lines here
+            while url == "":
+                if time.time() - start_timestamp >= TUNNEL_TIMEOUT_SECONDS:
+                    _raise_tunnel_error()
+
+                line = self.proc.stdout.readline().decode("utf-8")
+                if line == "":
+                    # EOF: frpc exited (or closed stdout) without printing a URL
+                    _raise_tunnel_error()
+
+                url = _consume_line(line)
+        else:
+            # Non-blocking fd + select so the loop blocks in the kernel with
+            # a bounded wait: the timeout fires even if frpc never writes a
+            # line, where a blocking readline() would hang past it
+            fd = self.proc.stdout.fileno()
+            os.set_blocking(fd, False)
+            buffer = b""
+
+            while url == "":
+                # check for timeout and log
+                remaining = TUNNEL_TIMEOUT_SECONDS - (time.time() - start_timestamp)
+                if remaining <= 0:
+                    _raise_tunnel_error()
+
+                ready, _, _ = select.select([fd], [], [], remaining)
+                if not ready:
+                    continue
+
+                chunk = os.read(fd, 4096)
+                if chunk == b"":
+                    # EOF: frpc exited (or closed stdout) without printing a URL
+                    _raise_tunnel_error()
+                buffer += chunk
+
+                while b"\n" in buffer and url == "":
+                    raw_line, buffer = buffer.split(b"\n", 1)
+                    url = _consume_line(raw_line.decode("utf-8") + "\n")
 
         if self.http:
             url = url.replace("https://", "http://")
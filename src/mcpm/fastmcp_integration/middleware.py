@@ -2,10 +2,11 @@
 FastMCP middleware adapters for MCPM monitoring and authentication.
 """
 
+import functools
 import logging
 import time
 import uuid
-from typing import Any
+from typing import Any, Optional
 
 import mcp.types as mt
 from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
@@ -15,6 +16,22 @@ from mcpm.monitor.base import AccessEventType, AccessMonitor, SessionSource, Ses
 # MCPMMonitoringMiddleware removed - functionality moved to MCPMUnifiedTrackingMiddleware
 
 
+@functools.lru_cache(maxsize=None)
+def _transport_for_server_type(cls: type) -> Optional[str]:
+    """Infer a transport from a FastMCP server class name.
+
+    Memoized on the class object — there are only a handful of server
+    classes, so the lowercase/substring scan runs once per class rather
+    than once per tracked request.
+    """
+    name = cls.__name__.lower()
+    if "stdio" in name:
+        return "stdio"
+    if "remote" in name or "http" in name:
+        return "http"
+    return None
+
+
 class MCPMDebugMiddleware(Middleware):
     """Debug middleware that logs all proxy activity including notifications when debug is enabled.
 
@@ -404,13 +421,11 @@ class MCPMUnifiedTrackingMiddleware(Middleware):
 
         # Try to infer from FastMCP server type
         if hasattr(context, "mcp_server"):
-            server = context.mcp_server
-            server_type = type(server).__name__
-            if "stdio" in server_type.lower():
-                server_info["transport"] = "stdio"
-            elif "remote" in server_type.lower() or "http" in server_type.lower():
-                server_info["transport"] = "http"
-            server_info["server_type"] = server_type
+            server_cls = type(context.mcp_server)
+            transport = _transport_for_server_type(server_cls)
+            if transport is not None:
+                server_info["transport"] = transport
+            server_info["server_type"] = server_cls.__name__
 
         # Use the transport from middleware if not detected
         if "transport" not in server_info:
@@ -12,6 +12,11 @@ from typing import Dict, List, Optional
 
 from pydantic import TypeAdapter
 
+try:  # optional C-accelerated JSON parser
+    import orjson
+except ImportError:
+    orjson = None
+
 from mcpm.core.schema import ProfileMetadata, ServerConfig
 
 DEFAULT_GLOBAL_CONFIG_PATH = os.path.expanduser("~/.config/mcpm/servers.json")
@@ -19,6 +24,24 @@ DEFAULT_PROFILE_METADATA_PATH = os.path.expanduser("~/.config/mcpm/profiles_meta
 
 logger = logging.getLogger(__name__)
 
+# Per-process parse caches keyed on file path, invalidated via mtime so
+# repeated manager instantiations within one CLI run skip JSON parsing.
+_servers_cache: Dict[str, tuple] = {}
+_metadata_cache: Dict[str, tuple] = {}
+
+
+def _load_json_file(path: str):
+    """Parse a JSON config file, using orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class GlobalConfigManager:
     """Manages the global MCPM server configuration.
@@ -43,12 +66,17 @@ class GlobalConfigManager:
 
     def _load_servers(self) -> Dict[str, ServerConfig]:
         """Load servers from the global configuration file."""
-        if not os.path.exists(self.config_path):
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
             return {}
 
+        cached = _servers_cache.get(self.config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                servers_data = json.load(f) or {}
+            servers_data = _load_json_file(self.config_path) or {}
         except json.JSONDecodeError as e:
             logger.error(f"Error loading global servers from {self.config_path}: {e}")
             return {}
@@ -61,6 +89,7 @@ class GlobalConfigManager:
                 logger.error(f"Error loading server {name}: {e}")
                 continue
 
+        _servers_cache[self.config_path] = (mtime_ns, dict(servers))
         return servers
 
     def _save_servers(self) -> None:
@@ -71,14 +100,21 @@ class GlobalConfigManager:
         with open(self.config_path, "w", encoding="utf-8") as f:
             json.dump(servers_data, f, indent=2)
 
+        _servers_cache[self.config_path] = (os.stat(self.config_path).st_mtime_ns, dict(self._servers))
+
     def _load_profile_metadata(self) -> Dict[str, ProfileMetadata]:
         """Load profile metadata from the metadata configuration file."""
-        if not os.path.exists(self.metadata_path):
+        try:
+            mtime_ns = os.stat(self.metadata_path).st_mtime_ns
+        except OSError:
             return {}
 
+        cached = _metadata_cache.get(self.metadata_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+
         try:
-            with open(self.metadata_path, "r", encoding="utf-8") as f:
-                metadata_data = json.load(f) or {}
+            metadata_data = _load_json_file(self.metadata_path) or {}
         except json.JSONDecodeError as e:
             logger.error(f"Error loading profile metadata from {self.metadata_path}: {e}")
             return {}
@@ -91,6 +127,7 @@ class GlobalConfigManager:
                 logger.error(f"Error loading profile metadata {name}: {e}")
                 continue
 
+        _metadata_cache[self.metadata_path] = (mtime_ns, dict(metadata))
         return metadata
 
     def _save_profile_metadata(self) -> None:
@@ -101,6 +138,8 @@ class GlobalConfigManager:
         with open(self.metadata_path, "w", encoding="utf-8") as f:
             json.dump(metadata_data, f, indent=2)
 
+        _metadata_cache[self.metadata_path] = (os.stat(self.metadata_path).st_mtime_ns, dict(self._profile_metadata))
+
     def add_server(self, server_config: ServerConfig, force: bool = False) -> bool:
         """Add a server to the global configuration.
 
@@ -231,6 +270,62 @@ class GlobalConfigManager:
         self._save_servers()
         return True
 
+    def set_profile_tag_servers(self, profile_tag: str, server_names) -> bool:
+        """Set a profile tag's membership to exactly the given servers.
+
+        Adds the tag to every named server and removes it from all others in
+        one pass, writing the configuration file at most once — unlike
+        per-server tagging, which saves on every call.
+
+        Args:
+            profile_tag: Profile tag to assign
+            server_names: Iterable of server names that should carry the tag
+
+        Returns:
+            bool: Success or failure
+        """
+        desired = set(server_names)
+        missing = desired - self._servers.keys()
+        if missing:
+            logger.warning(f"Server(s) not found: {', '.join(sorted(missing))}")
+            return False
+
+        changed = False
+        for name, config in self._servers.items():
+            if name in desired:
+                if not config.has_profile_tag(profile_tag):
+                    config.add_profile_tag(profile_tag)
+                    changed = True
+            elif config.has_profile_tag(profile_tag):
+                config.remove_profile_tag(profile_tag)
+                changed = True
+
+        if changed:
+            self._save_servers()
+        return True
+
+    def rename_profile_tag(self, old_tag: str, new_tag: str) -> int:
+        """Replace a profile tag on all servers that carry it.
+
+        Args:
+            old_tag: Profile tag to remove
+            new_tag: Profile tag to add in its place
+
+        Returns:
+            int: Number of servers retagged
+        """
+        count = 0
+        for config in self._servers.values():
+            if config.has_profile_tag(old_tag):
+                config.remove_profile_tag(old_tag)
+                config.add_profile_tag(new_tag)
+                count += 1
+
+        if count > 0:
+            self._save_servers()
+
+        return count
+
     def get_all_profile_tags(self) -> List[str]:
         """Get all unique profile tags across all servers.
 
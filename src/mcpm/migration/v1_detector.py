@@ -19,9 +19,35 @@ class V1ConfigDetector:
         self.config_dir = Path(config_dir) if config_dir else Path(DEFAULT_CONFIG_DIR)
         self.config_file = self.config_dir / "config.json"
         self.profiles_file = self.config_dir / "profiles.json"
+        self._has_v1_cache: Optional[tuple] = None
+
+    def _config_state_key(self) -> tuple:
+        """Mtime-based key over the candidate v1 files, for cache invalidation."""
+
+        def _mtime(path: Path):
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return None
+
+        return (_mtime(self.config_file), _mtime(self.profiles_file))
 
     def has_v1_config(self) -> bool:
-        """Check if v1 configuration files exist with actual v1 content"""
+        """Check if v1 configuration files exist with actual v1 content.
+
+        The result is memoized per detector, keyed on the candidate files'
+        mtimes, so repeated checks within one process skip re-parsing.
+        """
+        key = self._config_state_key()
+        if self._has_v1_cache is not None and self._has_v1_cache[0] == key:
+            return self._has_v1_cache[1]
+
+        result = self._detect_v1_config()
+        self._has_v1_cache = (key, result)
+        return result
+
+    def _detect_v1_config(self) -> bool:
+        """Uncached scan of the config files for v1 content."""
         # Check for legacy profiles file (clear indicator of v1)
         if self.profiles_file.exists():
             return True
@@ -7,7 +7,6 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
@@ -17,9 +16,10 @@ from mcpm.global_config import GlobalConfigManager
 from mcpm.migration.v1_detector import V1ConfigDetector
 from mcpm.profile.profile_config import ProfileConfigManager
 from mcpm.utils.config import DEFAULT_CONFIG_DIR, ConfigManager
+from mcpm.utils.console import get_console
 
 logger = logging.getLogger(__name__)
-console = Console()
+console = get_console()
 
 
 class V1ToV2Migrator:
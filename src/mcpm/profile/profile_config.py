@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from mcpm.core.schema import ProfileMetadata, ServerConfig
 from mcpm.global_config import GlobalConfigManager
@@ -27,9 +27,20 @@ class ProfileConfigManager:
         self.profile_path = os.path.expanduser(profile_path)
         self.global_config = global_config_manager or GlobalConfigManager()
 
+        # Per-instance memo for profile lookups; the backing file cannot
+        # change mid-invocation, so mutations through this manager are the
+        # only invalidation points
+        self._profile_cache: Dict[str, Optional[List[ServerConfig]]] = {}
+        self._profiles_list_cache: Optional[Dict[str, List[ServerConfig]]] = None
+
         # Note: Legacy profile migration is now handled by V1ToV2Migrator
         # to ensure it only happens after user confirms migration
 
+    def _invalidate_cache(self) -> None:
+        """Drop memoized lookups after any profile mutation."""
+        self._profile_cache.clear()
+        self._profiles_list_cache = None
+
     def _load_profiles(self) -> Dict[str, List[ServerConfig]]:
         """Legacy method - now returns virtual profiles from global config."""
         return self.list_profiles()
@@ -47,19 +58,26 @@ class ProfileConfigManager:
             return False
 
         # Create profile metadata
+        self._invalidate_cache()
         return self.global_config.create_profile_metadata(profile_name)
 
     def get_profile(self, profile_name: str) -> Optional[List[ServerConfig]]:
         """Get all servers in a profile."""
+        if profile_name in self._profile_cache:
+            return self._profile_cache[profile_name]
+
         # Check if profile exists (either has metadata or virtual servers)
         if not (
             self.global_config.get_profile_metadata(profile_name)
             or self.global_config.virtual_profile_exists(profile_name)
         ):
-            return None
+            result = None
+        else:
+            servers = self.global_config.get_servers_by_profile_tag(profile_name)
+            result = list(servers.values())
 
-        servers = self.global_config.get_servers_by_profile_tag(profile_name)
-        return list(servers.values())
+        self._profile_cache[profile_name] = result
+        return result
 
     def get_profile_server(self, profile_name: str, server_name: str) -> Optional[ServerConfig]:
         """Get a specific server from a profile."""
@@ -76,6 +94,7 @@ class ProfileConfigManager:
         self.global_config.add_server(config, force=True)
 
         # Tag server with profile
+        self._invalidate_cache()
         return self.global_config.add_profile_tag_to_server(config.name, profile_name)
 
     def delete_profile(self, profile_name: str) -> bool:
@@ -86,10 +105,14 @@ class ProfileConfigManager:
         # Delete profile metadata
         metadata_deleted = self.global_config.delete_profile_metadata(profile_name)
 
+        self._invalidate_cache()
         return removed_count > 0 or metadata_deleted
 
     def list_profiles(self) -> Dict[str, List[ServerConfig]]:
         """List all profiles and their servers."""
+        if self._profiles_list_cache is not None:
+            return self._profiles_list_cache
+
         profiles = {}
 
         # Get all virtual profiles
@@ -108,8 +131,22 @@ class ProfileConfigManager:
                 if server:
                     profiles[profile_name].append(server)
 
+        self._profiles_list_cache = profiles
         return profiles
 
+    def set_profile_servers(self, profile_name: str, server_names: Iterable[str]) -> bool:
+        """Replace a profile's server membership in a single config save.
+
+        Tags every named server and untags the rest in one pass, so updating
+        an N-server profile costs one write instead of N.
+        """
+        # Ensure profile metadata exists
+        if not self.global_config.get_profile_metadata(profile_name):
+            self.global_config.create_profile_metadata(profile_name)
+
+        self._invalidate_cache()
+        return self.global_config.set_profile_tag_servers(profile_name, server_names)
+
     def rename_profile(self, old_name: str, new_name: str) -> bool:
         """Rename a profile."""
         # Check if old profile exists
@@ -122,9 +159,6 @@ class ProfileConfigManager:
         if self.global_config.get_profile_metadata(new_name) or self.global_config.virtual_profile_exists(new_name):
             return False
 
-        # Get servers with old profile tag
-        servers_to_retag = self.global_config.get_servers_by_profile_tag(old_name)
-
         # Create new profile metadata
         old_metadata = self.global_config.get_profile_metadata(old_name)
         if old_metadata:
@@ -135,18 +169,18 @@ class ProfileConfigManager:
         else:
             self.global_config.create_profile_metadata(new_name)
 
-        # Retag all servers
-        for server_name in servers_to_retag.keys():
-            self.global_config.add_profile_tag_to_server(server_name, new_name)
-            self.global_config.remove_profile_tag_from_server(server_name, old_name)
+        # Retag all servers with a single config save
+        self.global_config.rename_profile_tag(old_name, new_name)
 
         # Delete old metadata
         self.global_config.delete_profile_metadata(old_name)
 
+        self._invalidate_cache()
         return True
 
     def remove_server(self, profile_name: str, server_name: str) -> bool:
         """Remove a server from a profile (removes profile tag from server)."""
+        self._invalidate_cache()
         return self.global_config.remove_profile_tag_from_server(server_name, profile_name)
 
     def clear_profile(self, profile_name: str) -> bool:
@@ -164,11 +198,12 @@ class ProfileConfigManager:
         if not self.global_config.get_profile_metadata(profile_name):
             self.global_config.create_profile_metadata(profile_name)
 
+        self._invalidate_cache()
         return True
 
     def reload(self) -> None:
-        """Reload profiles - no-op since virtual profiles are always current."""
-        pass
+        """Reload profiles by dropping memoized lookups."""
+        self._invalidate_cache()
 
     # New methods for virtual profile system
     def get_profile_metadata(self, profile_name: str) -> Optional[ProfileMetadata]:
@@ -193,6 +228,7 @@ class ProfileConfigManager:
 
         # Create profile metadata with description
         metadata = ProfileMetadata(name=profile_name, description=description)
+        self._invalidate_cache()
         return self.global_config.update_profile_metadata(metadata)
 
     def add_server_to_profile(self, profile_name: str, server_name: str) -> bool:
@@ -204,4 +240,5 @@ class ProfileConfigManager:
         ):
             self.global_config.create_profile_metadata(profile_name)
 
+        self._invalidate_cache()
         return self.global_config.add_profile_tag_to_server(server_name, profile_name)
@@ -7,6 +7,11 @@ import logging
 import os
 from typing import Any, Dict
 
+try:  # optional C-accelerated JSON parser
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Default configuration paths
@@ -21,6 +26,15 @@ DEFAULT_SHARE_ADDRESS = f"share.mcpm.sh:{DEFAULT_PORT}"
 NODE_EXECUTABLES = ["npx", "bunx", "pnpm dlx", "yarn dlx"]
 
 
+def _load_json_file(path: str):
+    """Parse a JSON config file, using orjson when installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ConfigManager:
     """Manages MCP basic configuration
 
@@ -46,8 +60,7 @@ class ConfigManager:
         """Load configuration from file or create default"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    self._config = json.load(f)
+                self._config = _load_json_file(self.config_path)
             except json.JSONDecodeError:
                 logger.error(f"Error parsing config file: {self.config_path}")
                 self._config = self._default_config()
@@ -59,8 +72,7 @@ class ConfigManager:
         """Load auth configuration from file or create default"""
         if os.path.exists(self.auth_path):
             try:
-                with open(self.auth_path, "r", encoding="utf-8") as f:
-                    self._auth_config = json.load(f)
+                self._auth_config = _load_json_file(self.auth_path)
             except json.JSONDecodeError:
                 logger.error(f"Error parsing auth file: {self.auth_path}")
                 self._auth_config = {}
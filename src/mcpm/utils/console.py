@@ -0,0 +1,16 @@
+"""Shared Rich console for MCPM commands."""
+
+from functools import lru_cache
+
+from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Return the process-wide Console, constructed on first use.
+
+    Console() probes the terminal (isatty, width, color support) at
+    construction; sharing one instance keeps that to a single probe no
+    matter how many command modules are imported.
+    """
+    return Console()
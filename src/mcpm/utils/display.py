@@ -5,14 +5,17 @@ Utility functions for displaying MCP server configurations
 import json
 
 from rich.console import Console
-from rich.markup import escape
 from rich.table import Table
+from rich.text import Text
 
 from mcpm.core.schema import CustomServerConfig, RemoteServerConfig, ServerConfig, STDIOServerConfig
 from mcpm.utils.scope import CLIENT_PREFIX, PROFILE_PREFIX
 
 console = Console()
 
+# Static separator between servers; printed without markup parsing
+_SEPARATOR = "  " + "-" * 50
+
 
 def print_server_config(server_config: ServerConfig, is_stashed=False, show_name=True):
     """Print detailed information about a server configuration.
@@ -22,57 +25,65 @@ def print_server_config(server_config: ServerConfig, is_stashed=False, show_name
         is_stashed: Whether the server is stashed (affects display style)
         show_name: Whether to show the server name (default True for backwards compatibility)
     """
-    # Server name and command
+    # Server name and command; Text.assemble skips the markup parser and
+    # needs no escaping of user-controlled values
     if show_name:
         if is_stashed:
-            console.print(f"[bold yellow]{server_config.name}[/] [dim](stashed)[/]")
+            console.print(Text.assemble((server_config.name, "bold yellow"), " ", ("(stashed)", "dim")))
         else:
-            console.print(f"[bold cyan]{server_config.name}[/]")
+            console.print(Text.assemble((server_config.name, "bold cyan")))
 
     if isinstance(server_config, RemoteServerConfig):
-        console.print(f"  Url: [green]{server_config.url}[/]")
+        console.print(Text.assemble("  Url: ", (server_config.url, "green")))
         headers = server_config.headers
         if headers:
-            console.print("  Headers:")
+            console.print("  Headers:", markup=False)
             for key, value in headers.items():
-                console.print(f'    [bold blue]{key}[/] = [green]"{value}"[/]')
-        console.print("  " + "-" * 50)
+                console.print(Text.assemble("    ", (key, "bold blue"), " = ", (f'"{value}"', "green")))
+        console.print(_SEPARATOR, markup=False, highlight=False)
         return
     if isinstance(server_config, CustomServerConfig):
-        console.print("  Type: [green]Custom[/]")
-        console.print("  " + "-" * 50)
-        console.print("  Config:")
+        console.print(Text.assemble("  Type: ", ("Custom", "green")))
+        console.print(_SEPARATOR, markup=False, highlight=False)
+        console.print("  Config:", markup=False)
         console.print(json.dumps(server_config.config, indent=2))
-        console.print("  " + "-" * 50)
+        console.print(_SEPARATOR, markup=False, highlight=False)
         return
 
     # Handle STDIOServerConfig - all remaining configs should be STDIO
     if not isinstance(server_config, STDIOServerConfig):
-        console.print("  Type: [red]Unknown server type[/]")
-        console.print("  " + "-" * 50)
+        console.print(Text.assemble("  Type: ", ("Unknown server type", "red")))
+        console.print(_SEPARATOR, markup=False, highlight=False)
         return
 
     command = server_config.command
-    console.print(f"  Command: [green]{command}[/]")
+    console.print(Text.assemble("  Command: ", (command, "green")))
 
-    # Display arguments
+    # Display arguments as a single assembled block (one print per server,
+    # no escaping needed since Text bypasses the markup parser)
     args = server_config.args
     if args:
-        console.print("  Arguments:")
+        arg_lines = Text("  Arguments:")
         for i, arg in enumerate(args):
-            console.print(f"    {i}: [yellow]{escape(arg)}[/]")
+            arg_lines.append(f"\n    {i}: ")
+            arg_lines.append(arg, style="yellow")
+        console.print(arg_lines)
 
-    # Display environment variables
+    # Display environment variables, likewise batched into one print
     env_vars = server_config.env
     if env_vars:
-        console.print("  Environment Variables:")
+        env_lines = Text("  Environment Variables:")
         for key, value in env_vars.items():
-            console.print(f'    [bold blue]{key}[/] = [green]"{value}"[/]')
+            env_lines.append("\n    ")
+            env_lines.append(key, style="bold blue")
+            env_lines.append(" = ")
+            env_lines.append(f'"{value}"', style="green")
+        console.print(env_lines)
     else:
-        console.print("  Environment Variables: [italic]None[/]")
+        console.print(Text.assemble("  Environment Variables: ", ("None", "italic")))
 
     # Add a separator line between servers
-    console.print("  " + "-" * 50)
+    console.print(_SEPARATOR, markup=False, highlight=False)
 
 
 def print_servers_table(servers):
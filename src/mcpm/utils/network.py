@@ -0,0 +1,37 @@
+"""Network helpers shared by the run and share commands."""
+
+import asyncio
+import os
+import socket
+
+
+def _scan_ports(preferred_port, max_attempts):
+    """Synchronous scan for an available port starting from preferred_port.
+
+    Reuses a single socket for the whole scan — on Linux a failed bind
+    leaves the socket unbound, so each probe is one bind syscall instead
+    of a socket create/close pair. SO_REUSEADDR avoids false negatives
+    from sockets lingering in TIME_WAIT; on Windows the option instead
+    allows binding over a live listener, so it is POSIX-only.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        if os.name != "nt":
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        for attempt in range(max_attempts):
+            try:
+                s.bind(("127.0.0.1", preferred_port + attempt))
+                return preferred_port + attempt
+            except OSError:
+                continue  # Port is busy, try next one
+
+    # If no port found, return the original (will likely fail but user will see the error)
+    return preferred_port
+
+
+async def find_available_port(preferred_port, max_attempts=10):
+    """Find an available port starting from preferred_port.
+
+    The bind probes are blocking syscalls, so they run on a worker thread
+    rather than stalling the event loop during startup.
+    """
+    return await asyncio.to_thread(_scan_ports, preferred_port, max_attempts)
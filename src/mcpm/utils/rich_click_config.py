@@ -2,6 +2,8 @@
 Rich-click configuration for MCPM CLI.
 """
 
+import sys
+
 import rich_click as click
 from rich.console import Console
 from rich.text import Text
@@ -9,6 +11,11 @@ from rich_gradient import Gradient
 
 from mcpm import __version__
 
+# Skip ANSI generation and style resolution entirely for piped/scripted
+# output (e.g. `mcpm ls | grep foo`); rich-click then takes the plain path
+if not sys.stdout.isatty():
+    click.rich_click.COLOR_SYSTEM = None
+
 # Configure rich-click globally for beautiful CLI formatting
 click.rich_click.USE_RICH_MARKUP = True
 click.rich_click.USE_MARKDOWN = True
@@ -171,6 +171,80 @@ def test_complete_profile_info(profile_manager):
     assert complete["servers"][0]["name"] == "complete-server"
 
 
+def test_set_profile_servers_bulk_retag(profile_manager, global_config):
+    """Test that set_profile_servers replaces membership with the given set"""
+    # Create servers and a profile containing the first two
+    for name in ("server-a", "server-b", "server-c"):
+        global_config.add_server(STDIOServerConfig(name=name, command="echo"))
+
+    profile_manager.new_profile("bulk-profile")
+    assert profile_manager.set_profile_servers("bulk-profile", ["server-a", "server-b"])
+
+    servers = profile_manager.get_profile("bulk-profile")
+    assert sorted(s.name for s in servers) == ["server-a", "server-b"]
+
+    # Re-setting with a different list strips the tag from unlisted servers
+    assert profile_manager.set_profile_servers("bulk-profile", ["server-c"])
+
+    servers = profile_manager.get_profile("bulk-profile")
+    assert [s.name for s in servers] == ["server-c"]
+    assert not global_config.get_server("server-a").has_profile_tag("bulk-profile")
+    assert not global_config.get_server("server-b").has_profile_tag("bulk-profile")
+
+
+def test_set_profile_servers_unknown_server(profile_manager, global_config):
+    """Test that set_profile_servers rejects unknown servers without retagging"""
+    global_config.add_server(STDIOServerConfig(name="known-server", command="echo"))
+    profile_manager.new_profile("strict-profile")
+    assert profile_manager.set_profile_servers("strict-profile", ["known-server"])
+
+    # A missing name fails the whole call and leaves existing tags intact
+    assert not profile_manager.set_profile_servers("strict-profile", ["no-such-server"])
+    assert global_config.get_server("known-server").has_profile_tag("strict-profile")
+
+
+def test_rename_profile_retags_servers(profile_manager, global_config):
+    """Test that renaming a profile moves the tag on every member server"""
+    for name in ("server-x", "server-y"):
+        profile_manager.set_profile("old-name", STDIOServerConfig(name=name, command="echo"))
+
+    assert profile_manager.rename_profile("old-name", "new-name")
+
+    # Servers carry only the new tag
+    for name in ("server-x", "server-y"):
+        server = global_config.get_server(name)
+        assert server.has_profile_tag("new-name")
+        assert not server.has_profile_tag("old-name")
+
+    assert profile_manager.get_profile("old-name") is None
+    assert len(profile_manager.get_profile("new-name")) == 2
+
+    # Renaming onto an existing profile is rejected
+    profile_manager.new_profile("taken")
+    assert not profile_manager.rename_profile("new-name", "taken")
+
+
+def test_cache_invalidation_on_mutation(profile_manager, global_config):
+    """Test that cached lookups are refreshed after profile mutations"""
+    global_config.add_server(STDIOServerConfig(name="cached-server", command="echo"))
+    profile_manager.new_profile("cached-profile")
+
+    # Prime both the per-profile and list caches
+    assert profile_manager.get_profile("cached-profile") == []
+    assert profile_manager.list_profiles()["cached-profile"] == []
+
+    # Bulk set must be visible immediately, not served from stale caches
+    profile_manager.set_profile_servers("cached-profile", ["cached-server"])
+    assert [s.name for s in profile_manager.get_profile("cached-profile")] == ["cached-server"]
+    assert [s.name for s in profile_manager.list_profiles()["cached-profile"]] == ["cached-server"]
+
+    # Same for rename: old name disappears, new name resolves
+    profile_manager.rename_profile("cached-profile", "renamed-profile")
+    assert profile_manager.get_profile("cached-profile") is None
+    assert "cached-profile" not in profile_manager.list_profiles()
+    assert [s.name for s in profile_manager.get_profile("renamed-profile")] == ["cached-server"]
+
+
 def test_no_data_duplication(profile_manager, global_config):
     """Test that servers are not duplicated between global config and profiles"""
     # Create server and add to profile